@@ -6,8 +6,60 @@ Each tile can be a road, building, or other type of terrain.
 The player moves around this grid to deliver packages.
 """
 
-from ..services.data_manager import DataManager
-from pathlib import Path
+from collections import deque, namedtuple
+
+# Buildings are always blocked, even if the legend forgets to say so
+BLOCKED_TILES = ('B',)
+
+# Movement cost used by the AI pathfinders (lower = faster)
+SURFACE_WEIGHTS = {
+    'C': 1.0,   # Road - fastest
+    'P': 2.0,   # Park - slower
+    'B': float('inf')  # Building - blocked
+}
+DEFAULT_SURFACE_WEIGHT = 2.0  # Default to park weight
+
+# Player speed used when the legend has no entry for a tile
+SPEED_MULTIPLIERS = {
+    'C': 1.0,   # Road - normal speed
+    'P': 0.5,   # Park - half speed
+    'B': 0.0    # Building - can't move
+}
+DEFAULT_SPEED_MULTIPLIER = 1.0
+
+# Everything the movement code needs to know about one tile type
+TileInfo = namedtuple("TileInfo", "blocked weight speed")
+DEFAULT_TILE_INFO = TileInfo(False, DEFAULT_SURFACE_WEIGHT,
+                             DEFAULT_SPEED_MULTIPLIER)
+
+# 4-connected moves: up, down, left, right (the order the AIs expand in)
+NEIGHBOR_OFFSETS = ((0, -1), (0, 1), (-1, 0), (1, 0))
+
+# Flips a 0/1 byte mask
+_INVERT_MASK = bytes([1, 0]) + bytes(254)
+# Turns a 0/1 byte mask into b"0"/b"1" digits for int(..., 2)
+_MASK_DIGITS = b"01" + bytes(254)
+
+
+def _tile_char(tile):
+    """Return the single character used to store a tile in the packed grid."""
+    if isinstance(tile, list):
+        tile = tile[0] if tile else ""
+    tile = str(tile)
+    return tile[0] if tile else " "
+
+
+def _pack_bits(mask):
+    """Pack a 0/1 byte mask into an int with bit i set for mask[i]."""
+    return int(mask[::-1].translate(_MASK_DIGITS), 2) if mask else 0
+
+
+def _cell_content(tile):
+    """Return the characters __str__ prints for a tile."""
+    if isinstance(tile, list):
+        # Take first character of each element in the tile list
+        return "".join(str(item)[0] for item in tile)
+    return str(tile)[0]
 
 
 class City:
@@ -19,6 +71,16 @@ class City:
     calculates distances between points.
     """
 
+    __slots__ = (
+        "name", "version", "width", "height", "tiles", "legend", "goal",
+        # Merged per-tile info and tables indexed by tile character ordinal
+        "_tile_info", "_blocked_tbl", "_weight_tbl", "_speed_tbl",
+        # Flat packed grid and derived caches
+        "_w", "_h", "_flat", "_codes", "_blocked_mask", "_walkable_mask",
+        "_walkable_cache", "_components", "_blocked_row_bits",
+        "_blocked_col_bits", "_padded_walkable",
+    )
+
     def __init__(self, city_data):
         """
         Create a new city from city data.
@@ -34,6 +96,105 @@ class City:
         self.legend = city_data.get("legend", {})
         self.goal = city_data.get("goal", 0)
 
+        self._build_lookup_tables()
+        self._build_grid()
+
+    def _build_lookup_tables(self):
+        """Precompute per-tile lookup tables indexed by character ordinal.
+
+        is_blocked, get_surface_weight and get_tile_speed_multiplier are
+        called from the pathfinders for every explored cell, so they read
+        these 256-entry tables instead of building dicts on each call.
+        """
+        self._tile_info = self._build_tile_info()
+        self._blocked_tbl = bytearray(256)
+        self._weight_tbl = [DEFAULT_SURFACE_WEIGHT] * 256
+        self._speed_tbl = [DEFAULT_SPEED_MULTIPLIER] * 256
+
+        for tile_type, info in self._tile_info.items():
+            code = ord(tile_type)
+            if code >= 256:
+                continue
+            self._blocked_tbl[code] = info.blocked
+            self._weight_tbl[code] = info.weight
+            self._speed_tbl[code] = info.speed
+
+    def _build_tile_info(self):
+        """Merge the built-in tile defaults and the legend per tile type.
+
+        Returns:
+            dict: Tile character -> TileInfo(blocked, weight, speed)
+        """
+        tile_types = (set(BLOCKED_TILES) | set(SURFACE_WEIGHTS)
+                      | set(SPEED_MULTIPLIERS)
+                      | {tile_type for tile_type in self.legend
+                         if len(tile_type) == 1})
+
+        tile_info = {}
+        for tile_type in tile_types:
+            legend_info = self.legend.get(tile_type)
+            blocked = (tile_type in BLOCKED_TILES or
+                       bool(legend_info and legend_info.get("blocked", False)))
+            weight = SURFACE_WEIGHTS.get(tile_type, DEFAULT_SURFACE_WEIGHT)
+            if legend_info is not None:
+                # Legend uses "surface_weight" where LOWER = FASTER
+                surface_weight = legend_info.get("surface_weight", 1.0)
+                speed = 1.0 / surface_weight if surface_weight > 0 else 1.0
+            else:
+                speed = SPEED_MULTIPLIERS.get(
+                    tile_type, DEFAULT_SPEED_MULTIPLIER)
+            tile_info[tile_type] = TileInfo(blocked, weight, speed)
+
+        return tile_info
+
+    def _build_grid(self):
+        """Flatten the tiles into one row-major buffer with a fixed stride.
+
+        _flat holds one character per tile and _codes the same tiles as a
+        contiguous uint8 buffer, so a lookup is a single index at
+        y * _w + x instead of two list dereferences. bytes.translate maps
+        _codes through the blocked table so the blocked mask for the whole
+        map is built in C instead of one Python call per tile.
+        """
+        self._h = len(self.tiles)
+        self._w = len(self.tiles[0]) if self._h else 0
+        self._walkable_cache = None
+        self._components = None
+        # Rows are padded/truncated to the first row's width to keep the
+        # stride fixed
+        self._flat = "".join(
+            "".join(_tile_char(tile) for tile in row)[:self._w].ljust(self._w)
+            for row in self.tiles)
+        self._codes = self._flat.encode("latin-1", "replace")
+        self._blocked_mask = self._codes.translate(self._blocked_tbl)
+        self._walkable_mask = self._blocked_mask.translate(_INVERT_MASK)
+
+        # Walkable mask with a one-tile border of zeros (stride _w + 2), so
+        # a neighbor lookup never needs its own bounds check
+        width, walkable = self._w, self._walkable_mask
+        border = bytes(width + 2)
+        self._padded_walkable = border + b"".join(
+            b"\0" + walkable[y * width:(y + 1) * width] + b"\0"
+            for y in range(self._h)) + border
+
+        # Blocked mask packed into one int per row and per column, with
+        # bit x (or y) set when that tile is blocked
+        width, height, blocked = self._w, self._h, self._blocked_mask
+        self._blocked_row_bits = [
+            _pack_bits(blocked[y * width:(y + 1) * width])
+            for y in range(height)]
+        self._blocked_col_bits = [
+            _pack_bits(blocked[x::width]) for x in range(width)]
+
+    def invalidate(self):
+        """Rebuild the packed grid and drop cached results.
+
+        The tile grid is treated as immutable after load; call this if
+        the tiles or legend are ever changed in place.
+        """
+        self._build_lookup_tables()
+        self._build_grid()
+
     def get_tile(self, x, y):
         """Get the tile at the specified coordinates.
 
@@ -44,8 +205,27 @@ class City:
         Returns:
             str or None: The tile type at (x, y) or None if invalid.
         """
-        if 0 <= y < len(self.tiles) and 0 <= x < len(self.tiles[y]):
-            return self.tiles[y][x]
+        if 0 <= y < self._h and 0 <= x < self._w:
+            return self._flat[y * self._w + x]
+        return None
+
+    def get_tile_info(self, x, y):
+        """Get blocked/weight/speed for the tile at the given coordinates.
+
+        One lookup instead of separate is_blocked, get_surface_weight and
+        get_tile_speed_multiplier calls. Also covers tile characters
+        outside the 256-entry lookup tables.
+
+        Args:
+            x (int): X coordinate.
+            y (int): Y coordinate.
+
+        Returns:
+            TileInfo or None: Info for the tile or None if invalid.
+        """
+        if 0 <= y < self._h and 0 <= x < self._w:
+            return self._tile_info.get(self._flat[y * self._w + x],
+                                       DEFAULT_TILE_INFO)
         return None
 
     def is_valid_position(self, x: int, y: int) -> bool:
@@ -59,21 +239,150 @@ class City:
         Returns:
             bool: True if position is valid (within bounds)
         """
-        if not hasattr(self, 'tiles') or not self.tiles:
-            return False
-
-        height = len(self.tiles)
-        width = len(self.tiles[0]) if height > 0 else 0
-
-        return 0 <= x < width and 0 <= y < height
+        return 0 <= x < self._w and 0 <= y < self._h
 
     def is_blocked(self, x: int, y: int) -> bool:
-        """Check if a tile is blocked (building 'B')."""
-        if not self.is_valid_position(x, y):
+        """Check if a tile is blocked (building 'B' or legend "blocked")."""
+        if not (0 <= x < self._w and 0 <= y < self._h):
             return True  # Out of bounds = blocked
 
-        tile_type = self.tiles[y][x]
-        return tile_type == 'B'  # Buildings are blocked
+        return self._blocked_mask[y * self._w + x] == 1
+
+    def is_blocked_many(self, xs, ys):
+        """Check many positions for blocking in one call.
+
+        Batched version of is_blocked for pathfinders and sweeps that
+        query several cells at once; avoids one method call per cell.
+
+        Args:
+            xs: Sequence of X coordinates
+            ys: Sequence of Y coordinates (same length as xs)
+
+        Returns:
+            list: One bool per position, True if blocked or out of bounds
+        """
+        width, height, blocked = self._w, self._h, self._blocked_mask
+        return [not (0 <= x < width and 0 <= y < height)
+                or blocked[y * width + x] == 1
+                for x, y in zip(xs, ys)]
+
+    def any_blocked_in_row(self, y: int, x0: int, x1: int) -> bool:
+        """Check if any tile from x0 to x1 (inclusive) on row y is blocked.
+
+        Uses the packed row bitmap, so the whole span is one shift and
+        mask no matter how long it is. Out of bounds counts as blocked.
+        """
+        if x0 > x1:
+            x0, x1 = x1, x0
+        if not (0 <= y < self._h) or x0 < 0 or x1 >= self._w:
+            return True
+        span = (1 << (x1 - x0 + 1)) - 1
+        return (self._blocked_row_bits[y] >> x0) & span != 0
+
+    def any_blocked_in_column(self, x: int, y0: int, y1: int) -> bool:
+        """Check if any tile from y0 to y1 (inclusive) on column x is blocked.
+
+        Column version of any_blocked_in_row.
+        """
+        if y0 > y1:
+            y0, y1 = y1, y0
+        if not (0 <= x < self._w) or y0 < 0 or y1 >= self._h:
+            return True
+        span = (1 << (y1 - y0 + 1)) - 1
+        return (self._blocked_col_bits[x] >> y0) & span != 0
+
+    def count_clear_steps(self, x: int, y: int, dx: int, dy: int,
+                          max_steps: int) -> int:
+        """Count how many tiles can be walked in a straight line from (x, y).
+
+        Steps from (x + dx, y + dy) onwards, where exactly one of dx/dy is
+        1 or -1, and stops at the first blocked or off-map tile or after
+        max_steps. Uses the packed row/column bitmaps, so the first blocked
+        tile is found with a few integer ops however far it looks.
+
+        Returns:
+            int: Number of walkable tiles before the first obstacle
+        """
+        if dy == 0:
+            inside, pos, size, step = 0 <= y < self._h, x, self._w, dx
+            bits = self._blocked_row_bits[y] if inside else 0
+        else:
+            inside, pos, size, step = 0 <= x < self._w, y, self._h, dy
+            bits = self._blocked_col_bits[x] if inside else 0
+        if not inside or not (0 <= pos < size):
+            # Starting off the map: walk it tile by tile
+            steps = 0
+            while (steps < max_steps and self.is_walkable(
+                    x + dx * (steps + 1), y + dy * (steps + 1))):
+                steps += 1
+            return steps
+
+        if step > 0:
+            # Tiles pos+1 .. pos+limit are bits 0 .. limit-1 of the window;
+            # the lowest set bit is the nearest obstacle
+            limit = min(max_steps, size - 1 - pos)
+            if limit <= 0:
+                return 0
+            window = (bits >> (pos + 1)) & ((1 << limit) - 1)
+            return (window & -window).bit_length() - 1 if window else limit
+
+        # Tiles pos-limit .. pos-1 are bits 0 .. limit-1 of the window; the
+        # highest set bit is the nearest obstacle
+        limit = min(max_steps, pos)
+        if limit <= 0:
+            return 0
+        window = (bits >> (pos - limit)) & ((1 << limit) - 1)
+        return limit - window.bit_length() if window else limit
+
+    def is_walkable(self, x: int, y: int) -> bool:
+        """Check if a position is inside the city and not blocked.
+
+        Same as ``is_valid_position(x, y) and not is_blocked(x, y)`` in a
+        single call, for the pathfinders' neighbor expansion loops.
+        """
+        return (0 <= x < self._w and 0 <= y < self._h
+                and self._blocked_mask[y * self._w + x] == 0)
+
+    def get_walkable_neighbors(self, x: int, y: int):
+        """Get the walkable 4-connected neighbors of a position.
+
+        Neighbors come in NEIGHBOR_OFFSETS order (up, down, left, right).
+
+        Args:
+            x: X coordinate
+            y: Y coordinate
+
+        Returns:
+            list: List of (x, y) tuples that can be stepped on
+        """
+        if not (0 <= x < self._w and 0 <= y < self._h):
+            return [pos for pos in ((x, y - 1), (x, y + 1), (x - 1, y), (x + 1, y))
+                    if self.is_walkable(*pos)]
+
+        # Every neighbor of an in-bounds tile lands inside the padded
+        # mask, and the border reads as not walkable
+        stride = self._w + 2
+        i = (y + 1) * stride + x + 1
+        walkable = self._padded_walkable
+        neighbors = []
+        if walkable[i - stride]:
+            neighbors.append((x, y - 1))
+        if walkable[i + stride]:
+            neighbors.append((x, y + 1))
+        if walkable[i - 1]:
+            neighbors.append((x - 1, y))
+        if walkable[i + 1]:
+            neighbors.append((x + 1, y))
+        return neighbors
+
+    @property
+    def walkable_mask(self):
+        """bytes: Row-major mask of the map, 1 for walkable tiles.
+
+        Index it with ``y * width + x``. Lets pathfinders read the grid
+        directly without going through City methods per cell.
+        """
+        return self._walkable_mask
 
     def get_surface_weight(self, x: int, y: int) -> float:
         """
@@ -91,19 +400,10 @@ class City:
         Returns:
             float: Surface weight (lower = faster movement)
         """
-        if not self.is_valid_position(x, y):
+        if not (0 <= x < self._w and 0 <= y < self._h):
             return float('inf')
 
-        tile_type = self.tiles[y][x]
-
-        # Surface weights based on tile type
-        weights = {
-            'C': 1.0,   # Road - fastest
-            'P': 2.0,   # Park - slower
-            'B': float('inf')  # Building - blocked
-        }
-
-        return weights.get(tile_type, 2.0)  # Default to park weight
+        return self._weight_tbl[self._codes[y * self._w + x]]
 
     def get_tile_speed_multiplier(self, x: int, y: int) -> float:
         """
@@ -122,42 +422,81 @@ class City:
         Returns:
             float: Speed multiplier (1.0 = normal, <1.0 = slower, >1.0 = faster)
         """
-        if not self.is_valid_position(x, y):
+        if not (0 <= x < self._w and 0 <= y < self._h):
             return 0.0  # Can't move out of bounds
 
-        tile_type = self.tiles[y][x]
+        # Legend speeds were folded into the table in __init__:
+        # Road (0.5 weight) → 2.0 speed
+        # Park (1.0 weight) → 1.0 speed
+        return self._speed_tbl[self._codes[y * self._w + x]]
+
+    def same_component(self, a, b) -> bool:
+        """Check if there is any walkable path between two positions.
 
-        # Try to get speed from legend first
-        if tile_type and tile_type in self.legend:
-            tile_info = self.legend[tile_type]
-            # Legend uses "surface_weight" where LOWER = FASTER
-            surface_weight = tile_info.get("surface_weight", 1.0)
-            # Convert to speed multiplier: lower weight = higher speed
-            # Road (0.5 weight) → 2.0 speed
-            # Park (1.0 weight) → 1.0 speed
-            return 1.0 / surface_weight if surface_weight > 0 else 1.0
+        Walkable tiles are labeled by 4-connected region the first time
+        this is called, so later checks are two lookups instead of a
+        search over the map.
 
-        # Fallback if no legend data
-        speed_multipliers = {
-            'C': 1.0,   # Road - normal speed
-            'P': 0.5,   # Park - half speed
-            'B': 0.0    # Building - can't move
-        }
+        Args:
+            a: (x, y) start position
+            b: (x, y) end position
 
-        return speed_multipliers.get(tile_type, 1.0)
+        Returns:
+            bool: True if both are walkable and connected
+        """
+        if self._components is None:
+            self._components = self._label_components()
+
+        (ax, ay), (bx, by) = a, b
+        width, height = self._w, self._h
+        if not (0 <= ax < width and 0 <= ay < height
+                and 0 <= bx < width and 0 <= by < height):
+            return False
+
+        label = self._components[ay * width + ax]
+        return label != 0 and label == self._components[by * width + bx]
+
+    def _label_components(self):
+        """Label each walkable tile with its connected region (0 = blocked)."""
+        width, height = self._w, self._h
+        walkable = self._walkable_mask
+        labels = [0] * (width * height)
+        next_label = 0
+
+        for start in range(width * height):
+            if not walkable[start] or labels[start]:
+                continue
+            next_label += 1
+            labels[start] = next_label
+            queue = deque([start])
+            while queue:
+                i = queue.popleft()
+                x = i % width
+                for n in (i - width, i + width,
+                          i - 1 if x > 0 else -1,
+                          i + 1 if x < width - 1 else -1):
+                    if (0 <= n < width * height and walkable[n]
+                            and not labels[n]):
+                        labels[n] = next_label
+                        queue.append(n)
+
+        return labels
 
     def get_walkable_tiles(self):
         """Get all walkable tile positions in the city.
 
+        The scan is done once and cached, since the grid does not change
+        after load (see invalidate()).
+
         Returns:
             list: List of (x, y) tuples representing walkable positions.
         """
-        walkable = []
-        for y in range(len(self.tiles)):
-            for x in range(len(self.tiles[y])):
-                if not self.is_blocked(x, y):
-                    walkable.append((x, y))
-        return walkable
+        if self._walkable_cache is None:
+            width = self._w
+            self._walkable_cache = tuple(
+                (i % width, i // width)
+                for i, blocked in enumerate(self._blocked_mask) if not blocked)
+        return list(self._walkable_cache)
 
     def __str__(self):
         """Return a string representation of the city map.
@@ -176,15 +515,7 @@ class City:
 
         # Map rows with more spacing between characters
         for row in self.tiles:
-            row_str = ""
-            for tile in row:
-                if isinstance(tile, list):
-                    # Take first character of each element in the tile list
-                    cell_content = "".join(str(item)[0] for item in tile)
-                else:
-                    cell_content = str(tile)[0]
-                row_str += cell_content + "  "
-            result.append(row_str)
+            result.append("  ".join(_cell_content(tile) for tile in row))
 
         return "\n".join(result)
 
@@ -208,6 +539,7 @@ class City:
         Raises:
             ValueError: If city data could not be loaded.
         """
+        from ..services.data_manager import DataManager
         data_manager = DataManager().get_instance()
         city_data = data_manager.load_city()
         if city_data is not None:
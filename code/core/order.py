@@ -8,6 +8,48 @@ amount, and deadline information.
 
 from typing import List, Optional, Tuple
 
+# Order states. Kept as plain strings because the views, inventories and
+# saved games all compare and store them directly. Literal strings are
+# interned, so comparisons against them hit the identity fast path; states
+# read back from a save are interned on restore for the same reason.
+STATE_AVAILABLE = "available"
+STATE_ACCEPTED = "accepted"
+STATE_CARRYING = "carrying"
+STATE_DELIVERED = "delivered"
+STATE_EXPIRED = "expired"
+STATE_CANCELLED = "cancelled"
+
+# Set to True to print deadline/expiry debug messages
+DEBUG = False
+
+# Seconds allowed to deliver, by priority:
+# Priority 0 = 120s, Priority 1 = 90s, Priority 2+ = 60s
+PRIORITY_BASE_TIME = (120, 90)
+DEFAULT_BASE_TIME = 60
+
+# Game time limit in seconds, set by the game through set_game_time_limit()
+# so expiry checks don't have to look up the Game singleton. None until a
+# game has started.
+_game_time_limit_s: Optional[float] = None
+
+
+def set_game_time_limit(limit_s: float) -> None:
+    """
+    Tell the order module how long a game lasts.
+
+    Called by Game on startup and when a saved game is restored.
+
+    Args:
+        limit_s: Game time limit in seconds
+    """
+    global _game_time_limit_s
+    _game_time_limit_s = float(limit_s)
+
+
+def game_time_limit() -> Optional[float]:
+    """Get the game time limit, or None if no game has set it yet."""
+    return _game_time_limit_s
+
 
 class Order:
     """
@@ -18,6 +60,17 @@ class Order:
     money you get, and when it needs to be delivered.
     """
 
+    __slots__ = (
+        "id", "pickup", "dropoff", "payout", "deadline_iso", "weight",
+        "priority", "state", "release_time", "deadline_s", "accepted_at",
+        "picked_at", "delivered_at", "sort_key",
+        "_pickup_x", "_pickup_y", "_dropoff_x", "_dropoff_y",
+        # Tracking flags set by the inventories and the save manager;
+        # left unset until first used (they are checked with hasattr)
+        "_was_released", "_last_debug_time", "_deadline_passed",
+        "_already_expired",
+    )
+
     def __init__(self, id: str, pickup: Tuple[int, int], dropoff: Tuple[int, int],
                  payout: float = 0.0, deadline_iso: str = None, weight: float = 0.0,
                  priority: int = 0, release_time: float = 0.0):
@@ -35,20 +88,43 @@ class Order:
             release_time: When this order becomes available
         """
         self.id: str = id
-        self.pickup: Tuple[int, int] = pickup
-        self.dropoff: Tuple[int, int] = dropoff
+        # JSON and older saves hand us lists; keep coordinates as tuples
+        self.pickup: Tuple[int, int] = tuple(pickup) if pickup else pickup
+        self.dropoff: Tuple[int, int] = tuple(dropoff) if dropoff else dropoff
         self.payout: float = float(payout)
         self.deadline_iso: Optional[str] = deadline_iso
         self.weight: float = float(weight)
         self.priority: int = int(priority)
         # available, accepted, carrying, delivered, expired, cancelled
-        self.state: str = "available"
+        self.state: str = STATE_AVAILABLE
         self.release_time: float = float(release_time)
         # This will be calculated when order is accepted
         self.deadline_s: Optional[float] = None
         self.accepted_at: Optional[float] = None
         self.picked_at: Optional[float] = None
         self.delivered_at: Optional[float] = None
+        # Job list order: higher priority first, then higher payout.
+        # Both are fixed at creation, so the key is built once here
+        self.sort_key: Tuple[int, float] = (-self.priority, -self.payout)
+        # Plain int coordinates for the adjacency checks run on every step
+        self._pickup_x, self._pickup_y = pickup[:2] if pickup else (None, None)
+        self._dropoff_x, self._dropoff_y = (
+            dropoff[:2] if dropoff else (None, None))
+
+    @staticmethod
+    def base_time_for_priority(priority: int) -> int:
+        """
+        Get how many seconds an order of this priority gets to be delivered.
+
+        Args:
+            priority: Order priority (0, 1, 2+)
+
+        Returns:
+            int: Seconds allowed (see PRIORITY_BASE_TIME)
+        """
+        if 0 <= priority < len(PRIORITY_BASE_TIME):
+            return PRIORITY_BASE_TIME[priority]
+        return DEFAULT_BASE_TIME
 
     def set_deadline_from_start(self, start_iso=None):
         """
@@ -56,31 +132,46 @@ class Order:
         For a game with a 10-minute timer, we want shorter deadlines.
         """
         # Store original deadline for reference
-        original_deadline = getattr(self, 'deadline_s', None)
-
-        # Set deadlines based on priority:
-        # Priority 0 = 120s, Priority 1 = 90s, Priority 2+ = 60s
-        if self.priority == 0:
-            base_time = 120
-        elif self.priority == 1:
-            base_time = 90  # Exactly 90 seconds for Priority 1
-        else:
-            base_time = 60  # 60 seconds for Priority 2+
+        original_deadline = self.deadline_s
+
+        # Set deadlines based on priority
+        base_time = self.base_time_for_priority(self.priority)
 
         # Add release time to get absolute game time
-        if hasattr(self, 'release_time') and self.release_time:
+        if self.release_time:
             self.deadline_s = self.release_time + base_time
         else:
             self.deadline_s = base_time
 
-        # Debug log the change but only once
-        if not hasattr(self, '_deadline_debug_printed'):
+        if DEBUG:
             if original_deadline:
                 print(
                     f"Order {self.id}: Adjusted deadline to {self.deadline_s}s (was {original_deadline}s)")
             else:
                 print(f"Order {self.id}: Set deadline to {self.deadline_s}s")
-            self._deadline_debug_printed = True
+
+    @classmethod
+    def bulk_set_deadlines(cls, orders: List["Order"], start_iso=None) -> None:
+        """
+        Set deadlines for a whole batch of freshly loaded orders.
+
+        Same result as calling set_deadline_from_start on each order, but
+        done in a single pass with the lookup table bound locally.
+
+        Args:
+            orders: Orders to update
+            start_iso: Kept for parity with set_deadline_from_start
+        """
+        n_base = len(PRIORITY_BASE_TIME)
+        for o in orders:
+            priority = o.priority
+            base_time = (PRIORITY_BASE_TIME[priority]
+                         if 0 <= priority < n_base else DEFAULT_BASE_TIME)
+            o.deadline_s = (o.release_time + base_time
+                            if o.release_time else base_time)
+
+        if DEBUG:
+            print(f"Order: Set deadlines for {len(orders)} orders")
 
     def is_expired(self, t: float) -> bool:
         """
@@ -94,26 +185,57 @@ class Order:
             bool: True if order has fully expired and should be removed
         """
         # NEVER expire orders that are being actively handled by the player
-        if self.state in ["accepted", "carrying"]:
+        if self.state != STATE_AVAILABLE:
+            return False
+
+        # No game clock yet, so nothing can have expired
+        if _game_time_limit_s is None:
+            return False
+
+        return self.is_expired_at(_game_time_limit_s - t)
+
+    def is_expired_at(self, elapsed_game_time: float) -> bool:
+        """
+        Same check as is_expired, but from the elapsed game time.
+
+        Lets callers checking many orders work out the elapsed time once
+        instead of once per order.
+
+        Args:
+            elapsed_game_time: Seconds since the game started
+
+        Returns:
+            bool: True if order has fully expired and should be removed
+        """
+        # Only "available" orders can expire, and only after very long
+        # periods. Orders being handled by the player ("accepted",
+        # "carrying") NEVER expire regardless of deadline.
+        if self.state != STATE_AVAILABLE:
             return False
 
-        # Only "available" orders can expire, and only after very long periods
-        if self.state == "available":
-            # Calculate elapsed time since order became available
-            from ..game.game import Game
-            game = Game()
-            elapsed_game_time = game._game_time_limit_s - t
-            time_available = elapsed_game_time - self.release_time
+        # Calculate elapsed time since order became available
+        time_available = elapsed_game_time - self.release_time
 
-            # Only expire if available for 10+ minutes without being accepted
-            if time_available > 600:  # 10 minutes = 600 seconds
+        # Only expire if available for 10+ minutes without being accepted
+        if time_available > 600:  # 10 minutes = 600 seconds
+            if DEBUG:
                 print(
                     f"Order {self.id} genuinely expired after being available for {time_available:.1f}s")
-                return True
+            return True
 
         # Default: don't expire
         return False
 
+    def is_near_pickup(self, x: int, y: int) -> bool:
+        """Check if (x, y) is at or adjacent (within 1 tile) to the pickup."""
+        return (-1 <= x - self._pickup_x <= 1 and
+                -1 <= y - self._pickup_y <= 1)
+
+    def is_near_dropoff(self, x: int, y: int) -> bool:
+        """Check if (x, y) is at or adjacent (within 1 tile) to the dropoff."""
+        return (-1 <= x - self._dropoff_x <= 1 and
+                -1 <= y - self._dropoff_y <= 1)
+
     def calculate_overtime(self, current_time: float) -> float:
         """
         Calculate how much overtime has accumulated for this order.
@@ -1,12 +1,79 @@
 from abc import ABC, abstractmethod
+from bisect import bisect_left
+from collections import OrderedDict, deque, namedtuple
+import heapq
+import math
+import random
 from tracemalloc import start
 import pygame
 import os
 
 from code.game import game
 
-from ..core.city import City
-from code.core import city
+from ..core.city import City, NEIGHBOR_OFFSETS
+from ..core.order import Order
+
+# Set to True to print per-move stamina/speed/reputation debug messages
+DEBUG = False
+
+# Debug snapshots returned by get_speed_info / get_reputation_stats
+SpeedInfo = namedtuple(
+    "SpeedInfo",
+    "final_speed movement_distance base_speed weather_multiplier "
+    "weight_multiplier reputation_multiplier resistance_multiplier "
+    "surface_multiplier current_weight reputation resistance_state")
+ReputationStats = namedtuple(
+    "ReputationStats",
+    "reputation streak payment_multiplier had_first_late_delivery_today "
+    "daily_stats excellence_bonus first_late_discount game_over")
+
+# Tiles per movement for each whole unit of speed: 1 per unit below 5,
+# then speed // 3, capped at 5 from speed 15 up
+MOVE_DISTANCE_BY_SPEED = (0, 1, 2, 3, 4, 1, 2, 2, 2, 3, 3, 3, 4, 4, 4, 5)
+
+# Facing directions, also the keys of the sprite dicts
+DIRECTION_UP = "UP"
+DIRECTION_DOWN = "DOWN"
+DIRECTION_LEFT = "LEFT"
+DIRECTION_RIGHT = "RIGHT"
+
+# Facing for a step sign of 1 / -1 (index -1 wraps to the last entry)
+FACING_BY_DX = (None, DIRECTION_RIGHT, DIRECTION_LEFT)
+FACING_BY_DY = (None, DIRECTION_DOWN, DIRECTION_UP)
+
+# Mresistencia for each resistance state
+RESISTANCE_MULTIPLIERS = {
+    "normal": 1.0,
+    "tired": 0.8,
+    "exhausted": 0.0
+}
+
+# Resistance state by stamina: exhausted at 0, tired up to 30, else normal
+RESISTANCE_STAMINA_THRESHOLDS = (0, 30)
+RESISTANCE_STATES = ("exhausted", "tired", "normal")
+
+# HardAI path cost multiplier for each resistance state (exhausted: 1.5)
+RESISTANCE_PATH_COSTS = {
+    "normal": 1.0,
+    "tired": 1.2,
+    "exhausted": 1.5
+}
+
+# Extra stamina lost per cell moved under each weather condition
+WEATHER_STAMINA_PENALTIES = {
+    "rain": -0.1,
+    "rain_light": -0.1,
+    "wind": -0.1,
+    "storm": -0.3,
+    "heat": -0.2,
+    "cold": -0.1,
+}
+
+# Late/expired penalties: up to 30s over, up to 120s over, anything later
+LATE_PENALTY_THRESHOLDS = (30, 120)
+LATE_PENALTIES = (-2, -5, -10)
+LATE_DELIVERY_LABELS = ("Slightly late delivery", "Late delivery",
+                        "Very late delivery")
 
 
 class AbstractAI(ABC):
@@ -15,6 +82,24 @@ class AbstractAI(ABC):
     Defines behavior modifiers for stamina, reputation, and player performance.
     """
 
+    # Attributes shared by every difficulty; subclasses keep their own
+    # state in a regular instance dict
+    __slots__ = (
+        "x", "y", "target_x", "target_y",
+        "is_moving", "move_progress", "move_speed", "current_direction",
+        "stamina", "_reputation", "_mrep", "_game_over", "streak",
+        "base_speed", "current_speed", "_weight", "_mpeso",
+        "_resistance_state", "_mresistencia",
+        "idle_time", "stamina_recovery_rate", "stamina_recovery_interval",
+        "recovery_threshold", "is_in_recovery_mode", "was_exhausted",
+        "successful_deliveries_streak", "had_first_late_delivery_today",
+        "stat_on_time", "stat_early", "stat_late", "stat_canceled",
+        "stat_lost",
+        "animation_frame", "animation_timer", "animation_speed",
+        "base_sprite_size", "current_sprite_size", "sprites",
+        "original_sprites", "jobs",
+    )
+
     def __init__(self, start_x=0, start_y=0):
 
         self.x = start_x
@@ -26,7 +111,7 @@ class AbstractAI(ABC):
         self.is_moving = False
         self.move_progress = 0.0
         self.move_speed = 0.7  # Speed of movement (0.0 to 1.0)
-        self.current_direction = "DOWN"
+        self.current_direction = DIRECTION_DOWN
 
         # Core player-like attributes
         self.stamina = 100
@@ -49,13 +134,11 @@ class AbstractAI(ABC):
         # Reputation system
         self.successful_deliveries_streak = 0
         self.had_first_late_delivery_today = False
-        self.daily_delivery_stats = {
-            "on_time": 0,
-            "early": 0,
-            "late": 0,
-            "canceled": 0,
-            "lost": 0
-        }
+        self.stat_on_time = 0
+        self.stat_early = 0
+        self.stat_late = 0
+        self.stat_canceled = 0
+        self.stat_lost = 0
 
         # Animation attributes
         self.animation_frame = 0
@@ -80,15 +163,17 @@ class AbstractAI(ABC):
             # Check if player is in recovery mode (cannot move until threshold is met)
             if self.is_in_recovery_mode:
                 if self.stamina < self.recovery_threshold:
-                    print(
-                        f"AI is in recovery mode - need {self.recovery_threshold} stamina to move (current: {self.stamina:.1f})")
+                    if DEBUG:
+                        print(
+                            f"AI is in recovery mode - need {self.recovery_threshold} stamina to move (current: {self.stamina:.1f})")
                     return False
                 else:
                     # Player has recovered enough, exit recovery mode
                     self.is_in_recovery_mode = False
                     self.was_exhausted = False
-                    print(
-                        f"AI recovered! Can move again (stamina: {self.stamina:.1f})")
+                    if DEBUG:
+                        print(
+                            f"AI recovered! Can move again (stamina: {self.stamina:.1f})")
 
             # Calculate current speed
             self.current_speed = self.calculate_speed(
@@ -96,17 +181,16 @@ class AbstractAI(ABC):
 
             # If speed is 0 (exhausted), cannot move
             if self.current_speed <= 0:
-                print("AI is exhausted - cannot move!")
+                if DEBUG:
+                    print("AI is exhausted - cannot move!")
                 return False
 
             # Movement distance based on speed
             max_distance = self.calculate_movement_distance()
 
-            # Calculate movement direction
-            direction_x = 1 if new_x > self.x else (
-                -1 if new_x < self.x else 0)
-            direction_y = 1 if new_y > self.y else (
-                -1 if new_y < self.y else 0)
+            # Calculate movement direction (-1, 0 or 1 on each axis)
+            direction_x = (new_x > self.x) - (new_x < self.x)
+            direction_y = (new_y > self.y) - (new_y < self.y)
 
             # Find final position considering obstacles
             final_x, final_y = self.find_final_position(
@@ -116,8 +200,10 @@ class AbstractAI(ABC):
             # Only move if there is a change in position
             if final_x != self.x or final_y != self.y:
 
-                distance_moved = max(abs(final_x - self.x),
-                                     abs(final_y - self.y))
+                # Moves go the same number of steps on every moving axis,
+                # so one axis is enough
+                distance_moved = (abs(final_x - self.x) if direction_x
+                                  else abs(final_y - self.y))
 
                 self.target_x = final_x
                 self.target_y = final_y
@@ -128,25 +214,28 @@ class AbstractAI(ABC):
                 self.idle_time = 0.0
 
                 # Update move_speed based on distance
-                self.update_move_speed_for_distance()
+                self.update_move_speed_for_distance(distance_moved)
 
                 # Update stamina after move
                 self.update_stamina_after_move(distance_moved, weather, city)
 
                 # Determine direction for animation
-                if final_x > self.x:
-                    self.current_direction = "RIGHT"
-                elif final_x < self.x:
-                    self.current_direction = "LEFT"
-                elif final_y > self.y:
-                    self.current_direction = "DOWN"
-                elif final_y < self.y:
-                    self.current_direction = "UP"
+                self.face_towards(final_x, final_y)
 
                 return True
 
         return False
 
+    def face_towards(self, new_x, new_y):
+        """Point current_direction at (new_x, new_y), horizontal first"""
+        dx = (new_x > self.x) - (new_x < self.x)
+        if dx:
+            self.current_direction = FACING_BY_DX[dx]
+            return
+        dy = (new_y > self.y) - (new_y < self.y)
+        if dy:
+            self.current_direction = FACING_BY_DY[dy]
+
     def can_move_to(self, new_x, new_y, city):
         # Check if the player can move to a position
         return (city.is_valid_position(new_x, new_y) and
@@ -155,23 +244,24 @@ class AbstractAI(ABC):
 
     def calculate_movement_distance(self):
         # High speed = more tiles per movement
-
-        if self.current_speed < 1.0:
+        speed = self.current_speed
+        if speed < 1.0:
             return 0
-        elif self.current_speed >= 1.0 and self.current_speed < 2.0:
-            return 1  # Normal speed = 1 tile
-        elif self.current_speed >= 2.0 and self.current_speed < 3.0:
-            return 2  # High speed = 2 tiles
-        elif self.current_speed >= 3.0 and self.current_speed < 4.0:
-            return 3  # Very high speed = 3 tiles
-        elif self.current_speed >= 4.0 and self.current_speed < 5.0:
-            return 4  # Extreme speed = 4 tiles
-        else:
-            # Max 5 tiles per movement
-            return min(5, int(self.current_speed // 3))
+        # Max 5 tiles per movement
+        return MOVE_DISTANCE_BY_SPEED[min(int(speed), 15)]
 
     def find_final_position(self, start_x, start_y, dir_x, dir_y, max_distance, city):
 
+        if max_distance <= 0:
+            return start_x, start_y
+
+        # Straight moves: the row/column bitmap gives the first obstacle
+        # along the whole span in one probe
+        if (dir_x == 0) != (dir_y == 0):
+            steps = city.count_clear_steps(
+                start_x, start_y, dir_x, dir_y, max_distance)
+            return start_x + dir_x * steps, start_y + dir_y * steps
+
         current_x, current_y = start_x, start_y
 
         for step in range(1, max_distance + 1):  # From 1 to max_distance
@@ -179,8 +269,7 @@ class AbstractAI(ABC):
             next_y = start_y + (dir_y * step)
 
             # Check if next position is valid and not blocked
-            if (city.is_valid_position(next_x, next_y) and
-                    not city.is_blocked(next_x, next_y)):
+            if city.is_walkable(next_x, next_y):
                 current_x, current_y = next_x, next_y
             else:
                 # If blocked, stop at previous position
@@ -194,21 +283,7 @@ class AbstractAI(ABC):
         v0 = self.base_speed
 
         # Mclima = weather speed multiplier
-        mclima = weather.get_speed_multiplier() if weather else 1.0
-
-        # Mpeso = max(0.8, 1 - 0.03 * weight)
-        mpeso = max(0.8, 1.0 - 0.03 * self.weight)
-
-        # Mrep = 1.03 if reputation ≥ 90, else 1.0
-        mrep = 1.03 if self.reputation >= 90 else 1.0
-
-        # Mresistencia based on resistance state
-        resistance_multipliers = {
-            "normal": 1.0,
-            "tired": 0.8,
-            "exhausted": 0.0
-        }
-        mresistencia = resistance_multipliers.get(self.resistance_state, 1.0)
+        mclima = weather.get_speed_multiplier() if weather is not None else 1.0
 
         # Surface_weight of current tile
         tile_speed_mult = 1.0  # Default
@@ -216,8 +291,10 @@ class AbstractAI(ABC):
             tile_speed_mult = city.get_tile_speed_multiplier(
                 current_tile_x, current_tile_y)
 
-        # Final speed calculation
-        final_speed = v0 * mclima * mpeso * mrep * mresistencia * tile_speed_mult
+        # Final speed calculation. Mpeso, Mrep and Mresistencia are kept up
+        # to date by the weight/reputation/resistance_state setters
+        final_speed = (v0 * mclima * self._mpeso * self._mrep *
+                       self._mresistencia * tile_speed_mult)
 
         return max(0.0, final_speed)  # Dont allow negative speed
 
@@ -226,28 +303,24 @@ class AbstractAI(ABC):
         speed = self.calculate_speed(weather, city, self.x, self.y)
 
         mclima = weather.get_speed_multiplier() if weather else 1.0
-        mpeso = max(0.8, 1.0 - 0.03 * self.weight)
-        mrep = 1.03 if self.reputation >= 90 else 1.0
-        mresistencia = {"normal": 1.0, "tired": 0.8,
-                        "exhausted": 0.0}.get(self.resistance_state, 1.0)
         tile_speed_mult = city.get_tile_speed_multiplier(
             self.x, self.y) if city else 1.0
 
         distance = self.calculate_movement_distance()
 
-        return {
-            "final_speed": speed,
-            "movement_distance": distance,
-            "base_speed": self.base_speed,
-            "weather_multiplier": mclima,
-            "weight_multiplier": mpeso,
-            "reputation_multiplier": mrep,
-            "resistance_multiplier": mresistencia,
-            "surface_multiplier": tile_speed_mult,
-            "current_weight": self.weight,
-            "reputation": self.reputation,
-            "resistance_state": self.resistance_state
-        }
+        return SpeedInfo(
+            final_speed=speed,
+            movement_distance=distance,
+            base_speed=self.base_speed,
+            weather_multiplier=mclima,
+            weight_multiplier=self._mpeso,
+            reputation_multiplier=self._mrep,
+            resistance_multiplier=self._mresistencia,
+            surface_multiplier=tile_speed_mult,
+            current_weight=self.weight,
+            reputation=self.reputation,
+            resistance_state=self.resistance_state
+        )
 
     def update_move_speed(self):
         # Update move_speed based on current_speed
@@ -258,10 +331,11 @@ class AbstractAI(ABC):
         else:
             self.move_speed = 0.0
 
-    def update_move_speed_for_distance(self):
-        # Calculate movement distance
-        distance = max(abs(self.target_x - self.x),
-                       abs(self.target_y - self.y))
+    def update_move_speed_for_distance(self, distance=None):
+        # Calculate movement distance unless the caller already knows it
+        if distance is None:
+            distance = max(abs(self.target_x - self.x),
+                           abs(self.target_y - self.y))
 
         if distance > 0 and self.current_speed > 0:
             # Base animation time - reduced values to make movements faster overall
@@ -286,10 +360,6 @@ class AbstractAI(ABC):
 
             # Convert to progress per frame (60 FPS)
             self.move_speed = min(1.0, 1.0 / (actual_animation_time * 60))
-
-            # Debug info to see the animation speed difference
-            print(
-                f"AI: Speed={self.current_speed:.1f}, Distance={distance}, AnimTime={actual_animation_time:.3f}, AnimSpeed={self.move_speed:.3f}")
         else:
             self.move_speed = 0.0
 
@@ -304,103 +374,99 @@ class AbstractAI(ABC):
 
         # Weather impact on stamina
         weather_penalty = 0.0
-        if weather and hasattr(weather, 'current_condition'):
-            weather_impacts = {
-                "rain": -0.1 * distance_moved,
-                "rain_light": -0.1 * distance_moved,
-                "wind": -0.1 * distance_moved,
-                "storm": -0.3 * distance_moved,
-                "heat": -0.2 * distance_moved,
-                "cold": -0.1 * distance_moved,
-            }
-            weather_penalty = weather_impacts.get(
-                weather.current_condition, 0.0)
+        if weather is not None:
+            weather_penalty = WEATHER_STAMINA_PENALTIES.get(
+                weather.current_condition, 0.0) * distance_moved
 
         # Total stamina loss
         total_stamina_loss = base_stamina_loss + weight_penalty + weather_penalty
 
         return total_stamina_loss
 
+    def _apply_stamina_delta(self, delta):
+        """
+        Change stamina by delta and update the states that depend on it.
+
+        Clamps stamina to 0-100, enters recovery mode when it just dropped
+        to 0, leaves it once the recovery threshold is reached, and sets
+        the resistance state.
+
+        Returns:
+            float: How much stamina actually changed
+        """
+        old_stamina = self.stamina
+        stamina = max(0, min(100, old_stamina + delta))
+        self.stamina = stamina
+
+        if stamina <= 0:
+            if old_stamina > 0:
+                # Just became exhausted
+                self.is_in_recovery_mode = True
+                self.was_exhausted = True
+                if DEBUG:
+                    print(
+                        f"AI exhausted! Entering recovery mode - must recover to {self.recovery_threshold} stamina to move again")
+        elif self.is_in_recovery_mode and stamina >= self.recovery_threshold:
+            self.is_in_recovery_mode = False
+            self.was_exhausted = False
+            if DEBUG:
+                print(
+                    f"Recovery threshold reached! AI can move again (stamina: {stamina:.1f})")
+
+        # Update resistance state based on new stamina. Stamina usually
+        # stays within a tier, so only go through the setter on a change
+        state = RESISTANCE_STATES[bisect_left(
+            RESISTANCE_STAMINA_THRESHOLDS, stamina)]
+        if state != self._resistance_state:
+            self.resistance_state = state
+
+        return stamina - old_stamina
+
     def update_stamina_after_move(self, distance_moved=1, weather=None, city=None):
         # Calculate stamina loss based on distance moved and conditions
         stamina_loss = self.calculate_stamina_loss(
             distance_moved, weather, city)  # get stamina loss
 
         # stamina_loss is negative
-        old_stamina = self.stamina
-        self.stamina = max(0, min(100, self.stamina + stamina_loss))
-
-        # Check if player just became exhausted (stamina reached 0)
-        if old_stamina > 0 and self.stamina <= 0:
-            self.is_in_recovery_mode = True
-            self.was_exhausted = True
-            print(
-                f"AI exhausted! Entering recovery mode - must recover to {self.recovery_threshold} stamina to move again")
-
-        # Update resistance state based on new stamina
-        if self.stamina > 30:
-            self.set_resistance_state("normal")
-        elif self.stamina <= 30 and self.stamina > 0:
-            self.set_resistance_state("tired")
-        else:
-            self.set_resistance_state("exhausted")
+        self._apply_stamina_delta(stamina_loss)
 
         # Debug info
-        print(
-            f"Stamina: {self.stamina:.1f} (lost {abs(stamina_loss):.1f}) - State: {self.resistance_state}")
+        if DEBUG:
+            print(
+                f"Stamina: {self.stamina:.1f} (lost {abs(stamina_loss):.1f}) - State: {self.resistance_state}")
 
     def recover_stamina(self, amount=5):
-        old_stamina = self.stamina
-
         # Increase stamina by amount, capped at 100
-        self.stamina = max(0, min(100, self.stamina + amount))
-
-        # Check if player exits recovery mode and update resistance state immediately
-        if self.is_in_recovery_mode and self.stamina >= self.recovery_threshold:
-            self.is_in_recovery_mode = False
-            self.was_exhausted = False
-            print(
-                f"Recovery threshold reached! AI can move again (stamina: {self.stamina:.1f})")
-
-        # Update resistance state based on new stamina - do this after checking recovery mode
-        if self.stamina > 30:
-            self.set_resistance_state("normal")
-        elif self.stamina <= 30 and self.stamina > 0:
-            self.set_resistance_state("tired")
-        else:
-            self.set_resistance_state("exhausted")
-            # If stamina drops to 0, enter recovery mode
-            if not self.is_in_recovery_mode and old_stamina > 0:
-                self.is_in_recovery_mode = True
-                self.was_exhausted = True
-                print(f"AI exhausted during recovery! Re-entering recovery mode")
+        actual_increase = self._apply_stamina_delta(amount)
 
         # Debug info
-        actual_increase = self.stamina - old_stamina
-        print(
-            f"Stamina increased by {actual_increase:.1f} → {self.stamina:.1f} - State: {self.resistance_state} - Recovery Mode: {self.is_in_recovery_mode}")
+        if DEBUG:
+            print(
+                f"Stamina increased by {actual_increase:.1f} → {self.stamina:.1f} - State: {self.resistance_state} - Recovery Mode: {self.is_in_recovery_mode}")
 
         return actual_increase
 
     def update(self, delta_time=1/60):
-        # Check if game is paused - don't update stamina recovery if paused
-        from code.game.game import Game
-        game = Game._instance
-        is_paused = game.is_paused() if hasattr(game, 'is_paused') else False
-
         # update movement and animation
         if self.is_moving:
             # Update movement progress
-            self.move_progress += self.move_speed * delta_time * 60  # Normalize FPS
+            progress = self.move_progress + self.move_speed * delta_time * 60  # Normalize FPS
 
-            if self.move_progress >= 1.0:
+            if progress >= 1.0:
                 # Movement complete
                 self.x = self.target_x
                 self.y = self.target_y
                 self.is_moving = False
                 self.move_progress = 0.0
+            else:
+                self.move_progress = progress
         else:
-            # Player is not moving - accumulate idle time ONLY if game is not paused
+            # Player is not moving - accumulate idle time ONLY if game is not paused.
+            # The game module is already imported at the top, so only look up
+            # the running instance here instead of importing on every frame
+            current_game = game.Game._instance
+            is_paused = (current_game.is_paused()
+                         if current_game is not None else False)
             if not is_paused:
                 self.idle_time += delta_time
 
@@ -419,7 +485,7 @@ class AbstractAI(ABC):
                         # Reset idle time, keeping any fractional remainder
                         self.idle_time = self.idle_time % self.stamina_recovery_interval
 
-                        if recovered > 0:
+                        if DEBUG and recovered > 0:
                             print(
                                 f"AI: Recovered {recovered:.1f} stamina from resting (idle for {recovery_cycles}s)")
 
@@ -479,6 +545,37 @@ class AbstractAI(ABC):
             pygame.draw.circle(screen, (255, 0, 0),
                                (screen_x, screen_y), radius)
 
+    @property
+    def weight(self):
+        return self._weight
+
+    @weight.setter
+    def weight(self, value):
+        self._weight = value
+        # Mpeso = max(0.8, 1 - 0.03 * weight)
+        self._mpeso = max(0.8, 1.0 - 0.03 * value)
+
+    @property
+    def reputation(self):
+        return self._reputation
+
+    @reputation.setter
+    def reputation(self, value):
+        self._reputation = value
+        # Mrep = 1.03 if reputation ≥ 90, else 1.0
+        self._mrep = 1.03 if value >= 90 else 1.0
+        # Game over once reputation drops below 20
+        self._game_over = value < 20
+
+    @property
+    def resistance_state(self):
+        return self._resistance_state
+
+    @resistance_state.setter
+    def resistance_state(self, state):
+        self._resistance_state = state
+        self._mresistencia = RESISTANCE_MULTIPLIERS.get(state, 1.0)
+
     def set_weight(self, new_weight):
         self.weight = new_weight  # Set weight directly
 
@@ -489,9 +586,32 @@ class AbstractAI(ABC):
         self.weight = max(0, self.weight - amount)  # Dont go below 0
 
     def set_resistance_state(self, state):
-        if state in ["normal", "tired", "exhausted"]:  # Valid states
+        if state in RESISTANCE_MULTIPLIERS:  # Valid states
             self.resistance_state = state  # Set state
 
+    def _late_penalty(self, overtime_seconds):
+        """
+        Look up the reputation penalty for a late or expired package.
+
+        The first one of the day only costs half while reputation is 85 or
+        more; using it marks it as spent.
+
+        Args:
+            overtime_seconds: How many seconds past the deadline
+
+        Returns:
+            tuple: (penalty level index, reputation penalty)
+        """
+        level = bisect_left(LATE_PENALTY_THRESHOLDS, overtime_seconds)
+        penalty = LATE_PENALTIES[level]
+
+        # Apply half penalty for first late delivery if reputation ≥ 85
+        if self.reputation >= 85 and not self.had_first_late_delivery_today:
+            self.had_first_late_delivery_today = True
+            penalty = penalty / 2
+
+        return level, penalty
+
     def update_reputation_delivery(self, delivery_time, deadline, is_canceled=False, is_lost=False, overtime_seconds=0):
         """
         Update reputation based on delivery outcome
@@ -507,6 +627,7 @@ class AbstractAI(ABC):
             dict: Information about reputation change
         """
         old_reputation = self.reputation
+        streak = self.successful_deliveries_streak
         reputation_change = 0
         message = ""
 
@@ -514,101 +635,62 @@ class AbstractAI(ABC):
             # Canceling an accepted order
             reputation_change = -4
             message = "Order canceled: -4 reputation"
-            self.successful_deliveries_streak = 0
-            self.daily_delivery_stats["canceled"] += 1
+            streak = 0
+            self.stat_canceled += 1
 
         elif is_lost:
             # Losing/expiring a package - use overtime calculation for penalty
             # but track as "lost" in statistics
-            self.daily_delivery_stats["lost"] += 1
-            self.successful_deliveries_streak = 0
-
-            # Apply half penalty for first late delivery if reputation ≥ 85
-            apply_half_penalty = (
-                self.reputation >= 85 and not self.had_first_late_delivery_today)
+            self.stat_lost += 1
+            streak = 0
 
             # Use explicit overtime for penalties (just like late deliveries)
-            if overtime_seconds <= 30:
-                base_penalty = -2
-                penalty = base_penalty / 2 if apply_half_penalty else base_penalty
-                reputation_change = penalty
-                message = f"Expired package (overtime {overtime_seconds:.1f}s): {penalty} reputation"
-            elif overtime_seconds <= 120:
-                base_penalty = -5
-                penalty = base_penalty / 2 if apply_half_penalty else base_penalty
-                reputation_change = penalty
-                message = f"Expired package (overtime {overtime_seconds:.1f}s): {penalty} reputation"
-            else:
-                base_penalty = -10
-                penalty = base_penalty / 2 if apply_half_penalty else base_penalty
-                reputation_change = penalty
-                message = f"Expired package (overtime {overtime_seconds:.1f}s): {penalty} reputation"
-
-            # Mark first late delivery used
-            if apply_half_penalty:
-                self.had_first_late_delivery_today = True
+            _, penalty = self._late_penalty(overtime_seconds)
+            reputation_change = penalty
+            message = f"Expired package (overtime {overtime_seconds:.1f}s): {penalty} reputation"
 
         else:
             # Normal delivery - check timing
             # Calculate time remaining (could be negative if late)
             time_remaining = deadline - delivery_time
-            # 20% of the total deadline time
-            early_threshold = (
-                deadline - (delivery_time - overtime_seconds)) * 0.2
-            is_late = overtime_seconds > 0
 
-            print(
-                f"DEBUG REPUTATION: time_remaining={time_remaining:.1f}, early_threshold={early_threshold:.1f}, overtime={overtime_seconds:.1f}s")
+            if DEBUG:
+                print(
+                    f"DEBUG REPUTATION: time_remaining={time_remaining:.1f}, overtime={overtime_seconds:.1f}s")
+
+            if overtime_seconds > 0:
+                # Late delivery - use explicit overtime calculation
+                self.stat_late += 1
+
+                # Use exact overtime for penalties
+                level, penalty = self._late_penalty(overtime_seconds)
+                reputation_change = penalty
+                message = f"{LATE_DELIVERY_LABELS[level]} ({overtime_seconds:.1f}s): {penalty} reputation"
 
-            if not is_late and time_remaining >= early_threshold:
+                # Reset streak on late delivery
+                streak = 0
+
+            # Not late: early if at least 20% of the total deadline time is left
+            elif time_remaining >= (
+                    deadline - (delivery_time - overtime_seconds)) * 0.2:
                 # Early delivery (≥20% before deadline)
                 reputation_change = 5
                 message = "Early delivery: +5 reputation"
-                self.successful_deliveries_streak += 1
-                self.daily_delivery_stats["early"] += 1
+                streak += 1
+                self.stat_early += 1
 
-            elif not is_late:
+            else:
                 # On-time delivery
                 reputation_change = 3
                 message = "On-time delivery: +3 reputation"
-                self.successful_deliveries_streak += 1
-                self.daily_delivery_stats["on_time"] += 1
-
-            else:
-                # Late delivery - use explicit overtime calculation
-                self.daily_delivery_stats["late"] += 1
-
-                # Apply half penalty for first late delivery if reputation ≥ 85
-                apply_half_penalty = (
-                    self.reputation >= 85 and not self.had_first_late_delivery_today)
-
-                # Use exact overtime for penalties
-                if overtime_seconds <= 30:
-                    base_penalty = -2
-                    penalty = base_penalty / 2 if apply_half_penalty else base_penalty
-                    reputation_change = penalty
-                    message = f"Slightly late delivery ({overtime_seconds:.1f}s): {penalty} reputation"
-                elif overtime_seconds <= 120:
-                    base_penalty = -5
-                    penalty = base_penalty / 2 if apply_half_penalty else base_penalty
-                    reputation_change = penalty
-                    message = f"Late delivery ({overtime_seconds:.1f}s): {penalty} reputation"
-                else:
-                    base_penalty = -10
-                    penalty = base_penalty / 2 if apply_half_penalty else base_penalty
-                    reputation_change = penalty
-                    message = f"Very late delivery ({overtime_seconds:.1f}s): {penalty} reputation"
-
-                # Mark first late delivery used
-                if apply_half_penalty:
-                    self.had_first_late_delivery_today = True
+                streak += 1
+                self.stat_on_time += 1
 
-                # Reset streak on late delivery
-                self.successful_deliveries_streak = 0
+        self.successful_deliveries_streak = streak
 
         # Check for streak bonus (3 successful deliveries without penalties)
         streak_bonus = 0
-        if self.successful_deliveries_streak == 3:
+        if streak == 3:
             streak_bonus = 2
             message += " + Streak bonus: +2 reputation"
             # Don't reset streak, allow it to keep counting for visibility
@@ -632,29 +714,33 @@ class AbstractAI(ABC):
             # Never reduce below 20 (game over threshold) from a single event
             if old_reputation - actual_loss < 20.0 and old_reputation >= 20.0:
                 actual_loss = old_reputation - 20.0
-                print(
-                    f"DEBUG REPUTATION: Limiting loss to prevent dropping below game over threshold")
+                if DEBUG:
+                    print(
+                        f"DEBUG REPUTATION: Limiting loss to prevent dropping below game over threshold")
 
-            print(
-                f"DEBUG REPUTATION: Processing loss: raw={total_change}, adjusted to -{actual_loss:.1f}")
+            if DEBUG:
+                print(
+                    f"DEBUG REPUTATION: Processing loss: raw={total_change}, adjusted to -{actual_loss:.1f}")
             total_change = -actual_loss
 
-        print(
-            f"DEBUG REPUTATION: old={old_reputation:.1f}, change={total_change:.1f}")
+        if DEBUG:
+            print(
+                f"DEBUG REPUTATION: old={old_reputation:.1f}, change={total_change:.1f}")
         self.add_reputation(total_change)
 
         new_reputation = self.reputation
-        print(
-            f"DEBUG REPUTATION: new={new_reputation:.1f}, absolute loss={old_reputation - new_reputation:.1f}")
+        if DEBUG:
+            print(
+                f"DEBUG REPUTATION: new={new_reputation:.1f}, absolute loss={old_reputation - new_reputation:.1f}")
 
         # Check game over condition
-        game_over = self.reputation < 20
+        game_over = self._game_over
 
         return {
             "old_reputation": old_reputation,
-            "new_reputation": self.reputation,
+            "new_reputation": new_reputation,
             "change": total_change,
-            "streak": self.successful_deliveries_streak,
+            "streak": streak,
             "message": message,
             "game_over": game_over
         }
@@ -671,40 +757,40 @@ class AbstractAI(ABC):
         """Add to reputation value with improved safeguards"""
         old_rep = self.reputation
 
-        # Calculate new reputation with min/max bounds
-        new_rep = max(0.0, min(100.0, self.reputation + amount))
-
         # Special case: if reputation was already at or near zero, and we're trying to decrease it further
         if amount < 0 and old_rep < 5.0:
             # Keep at the current value or ensure it's at least 1
             new_rep = max(1.0, old_rep)
-            print(
-                f"DEBUG REPUTATION: Already at minimal reputation, keeping at {new_rep}")
+            if DEBUG:
+                print(
+                    f"DEBUG REPUTATION: Already at minimal reputation, keeping at {new_rep}")
+        else:
+            # Calculate new reputation with min/max bounds
+            new_rep = max(0.0, min(100.0, old_rep + amount))
 
         # Final assignment
         self.reputation = new_rep
 
         # Debug information
-        if amount != 0:
+        if DEBUG and amount != 0:
             print(
                 f"DEBUG REPUTATION: Final adjustment: {old_rep:.1f} → {self.reputation:.1f} (change: {self.reputation - old_rep:.1f})")
 
     def reset_daily_reputation_tracking(self):
         """Reset daily tracking variables and ensure reputation is not 0 (call at start of new game day)"""
         self.had_first_late_delivery_today = False
-        self.daily_delivery_stats = {
-            "on_time": 0,
-            "early": 0,
-            "late": 0,
-            "canceled": 0,
-            "lost": 0
-        }
+        self.stat_on_time = 0
+        self.stat_early = 0
+        self.stat_late = 0
+        self.stat_canceled = 0
+        self.stat_lost = 0
 
         # Ensure reputation is not 0 at game start - should always start at 70
         if self.reputation < 20.0:
             self.reputation = 70.0
-            print(
-                f"DEBUG REPUTATION: Reset reputation to {self.reputation} for new game")
+            if DEBUG:
+                print(
+                    f"DEBUG REPUTATION: Reset reputation to {self.reputation} for new game")
 
     def get_payment_multiplier(self):
         """Calculate payment multiplier based on reputation"""
@@ -715,26 +801,31 @@ class AbstractAI(ABC):
 
     def is_game_over_by_reputation(self):
         """Check if reputation has dropped below game-over threshold"""
-        return self.reputation < 20
+        return self._game_over
 
-    def get_reputation_stats(self):
-        """Get comprehensive stats about reputation and delivery performance"""
+    @property
+    def daily_delivery_stats(self):
+        """Today's delivery counts, in the same shape the player uses"""
         return {
-            "reputation": self.reputation,
-            "streak": self.successful_deliveries_streak,
-            "payment_multiplier": self.get_payment_multiplier(),
-            "had_first_late_delivery_today": self.had_first_late_delivery_today,
-            "daily_stats": self.daily_delivery_stats,
-            "excellence_bonus": self.reputation >= 90,
-            "first_late_discount": self.reputation >= 85 and not self.had_first_late_delivery_today,
-            "game_over": self.reputation < 20
+            "on_time": self.stat_on_time,
+            "early": self.stat_early,
+            "late": self.stat_late,
+            "canceled": self.stat_canceled,
+            "lost": self.stat_lost
         }
 
-    def is_game_over_by_reputation(self):
-        """Check if reputation has dropped below game-over threshold"""
-        if self.reputation < 20:
-            return True
-        return False
+    def get_reputation_stats(self):
+        """Get comprehensive stats about reputation and delivery performance"""
+        return ReputationStats(
+            reputation=self.reputation,
+            streak=self.successful_deliveries_streak,
+            payment_multiplier=self.get_payment_multiplier(),
+            had_first_late_delivery_today=self.had_first_late_delivery_today,
+            daily_stats=self.daily_delivery_stats,
+            excellence_bonus=self.reputation >= 90,
+            first_late_discount=self.reputation >= 85 and not self.had_first_late_delivery_today,
+            game_over=self._game_over
+        )
 
     @abstractmethod
     def run_bot_logic(self, game, delta_time):
@@ -752,8 +843,8 @@ class EasyAI(AbstractAI):
     Easy difficulty AI using random decision making.
 
     This AI uses simple probabilistic logic and queue-based movement.
-    It randomly selects jobs and moves in random directions, avoiding
-    only obvious obstacles.
+    It takes jobs by a simple priority index and mostly follows a route
+    to its target, wandering randomly the rest of the time.
 
     Complexity Analysis:
     - Job selection: O(n) where n is number of available jobs
@@ -765,6 +856,17 @@ class EasyAI(AbstractAI):
     - Queue (FIFO): For managing movement direction sequence
     """
 
+    __slots__ = (
+        "accepted_orders", "active_order", "direction_queue",
+        "decision_timer", "decision_interval",
+        "direction_change_probability", "job_selection_timer",
+        "job_selection_interval", "target_position", "target_type",
+        "_path", "_path_index", "_path_goal", "_selectable_cache",
+        "_last_pickup_check", "city", "weather", "inventory",
+        "current_path", "path_recompute_needed", "is_idle_mode",
+        "idle_current_circle_index", "_idle_recovery_notified",
+    )
+
     def __init__(self, start_x=0, start_y=0):
         """
         Initialize Easy AI with random movement capabilities.
@@ -776,8 +878,8 @@ class EasyAI(AbstractAI):
         super().__init__(start_x, start_y)
 
         # AI-specific inventory system
-        from collections import deque
-        self.accepted_orders = []  # List to store accepted orders
+        # Accepted orders by id, in the order they were accepted
+        self.accepted_orders = OrderedDict()
         self.active_order = None   # Currently active order
         # FIFO queue for movement directions
         self.direction_queue = deque(maxlen=5)
@@ -796,6 +898,18 @@ class EasyAI(AbstractAI):
         self.target_position = None
         self.target_type = None  # "pickup" or "dropoff"
 
+        # Cached A* route to target_position: tiles in order, plus the
+        # index of each tile so we can find where we are on it in O(1)
+        self._path = ()
+        self._path_index = {}
+        self._path_goal = None
+
+        # (jobs inventory, game-clock second, weight room, selectable jobs)
+        # of the last scan
+        self._selectable_cache = (None, None, None, ())
+        # (x, y, order, order state) last handled by _check_pickup_delivery
+        self._last_pickup_check = None
+
         self.city = None
         self.weather = None
 
@@ -807,8 +921,9 @@ class EasyAI(AbstractAI):
         leftover state from previous sessions.
         """
         # Clear job state
-        self.accepted_orders = []
+        self.accepted_orders = OrderedDict()
         self.active_order = None
+        self.direction_queue.clear()
 
         # Reset timers
         self.decision_timer = 0.0
@@ -819,6 +934,11 @@ class EasyAI(AbstractAI):
         self.path_recompute_needed = False
         self.target_position = None
         self.target_type = None
+        self._path = ()
+        self._path_index = {}
+        self._path_goal = None
+        self._selectable_cache = (None, None, None, ())
+        self._last_pickup_check = None
 
         # Clear idle mode state
         self.is_idle_mode = False
@@ -839,65 +959,86 @@ class EasyAI(AbstractAI):
         self.move_progress = 0.0
         self.idle_time = 0.0
 
-        print(f"[HardAI] State reset for new game")
+        if DEBUG:
+            print(f"[EasyAI] State reset for new game")
 
     def get_name(self):
         """Return AI difficulty name."""
         return "Easy"
 
-    def _select_random_job(self, game):
+    def _select_job(self, game, game_time_remaining, elapsed_game_time):
         """
-        Randomly select an available job from the jobs inventory.
+        Select an available job from the jobs inventory by priority index.
 
-        AI must wait 1 second after an order appears before selecting it,
+        AI must wait 3 seconds after an order appears before selecting it,
         giving human players a fair chance to grab orders first.
 
-        Uses random selection from a list of available jobs.
+        Each eligible job gets the index
+        Z = payout * (priority + 1) - 0.5 * distance - 0.1 * slack,
+        where distance is the Manhattan distance to the pickup and slack the
+        seconds left before its deadline, and the highest Z wins.
 
         Complexity: O(n) where n is number of available jobs
 
         Args:
             game: The game instance to access job inventory
+            game_time_remaining: Game clock (seconds left) for this tick
+            elapsed_game_time: Seconds elapsed since the game started
 
         Returns:
-            Order or None: Randomly selected order if available
+            Order or None: Highest-index order if any is available
         """
-        import random
-
         jobs_inventory = self.jobs
-        game_time = game.get_game_time()
 
-        # Get all selectable jobs
-        available_jobs = jobs_inventory.selectable(game_time)
+        # Get all selectable jobs. The inventory scan is reused for the rest
+        # of the current game-clock second; a job released meanwhile could
+        # not pass the 3 second wait below yet anyway. Jobs we couldn't carry
+        # right now are left out, so we never pick one just to fail pickup
+        bucket = int(game_time_remaining)
+        max_weight = 8.0 - self.weight
+        cached_inventory, cached_bucket, cached_weight, available_jobs = \
+            self._selectable_cache
+        if (cached_inventory is not jobs_inventory or cached_bucket != bucket
+                or cached_weight != max_weight):
+            available_jobs = jobs_inventory.selectable(
+                game_time_remaining, max_weight=max_weight)
+            self._selectable_cache = (
+                jobs_inventory, bucket, max_weight, available_jobs)
 
         if not available_jobs:
             return None
 
-        # Filter jobs: AI must wait 3 seconds after order appears
-        game_time_remaining = game.get_game_time()
-        elapsed_game_time = game._game_time_limit_s - game_time_remaining
-
-        eligible_jobs = []
+        # Single pass: AI must wait 3 seconds after order appears, skip any
+        # taken (by us or the player) since the scan, keep the best index
+        x = self.x
+        y = self.y
+        selected_job = None
+        best_score = 0.0
         for job in available_jobs:
-            time_since_appearance = elapsed_game_time - job.release_time
-            if time_since_appearance >= 3.0:  # Wait 3 seconds
-                eligible_jobs.append(job)
+            if elapsed_game_time - job.release_time < 3.0 or job.state != "available":
+                continue
 
-        if not eligible_jobs:
-            return None
+            pickup_x, pickup_y = job.pickup
+            distance = abs(x - pickup_x) + abs(y - pickup_y)
+            deadline = job.deadline_s
+            slack = deadline - elapsed_game_time if deadline is not None else 0.0
+            score = (job.payout * (job.priority + 1) - 0.5 * distance
+                     - 0.1 * (slack if slack > 0.0 else 0.0))
 
-        # Random selection from eligible jobs - O(1) operation on list
-        selected_job = random.choice(eligible_jobs)
+            if selected_job is None or score > best_score:
+                selected_job = job
+                best_score = score
 
         return selected_job
 
-    def _accept_job(self, game, order):
+    def _accept_job(self, game, order, elapsed_game_time):
         """
         Accept a job and add it to AI's inventory.
 
         Args:
             game: The game instance
             order: The order to accept
+            elapsed_game_time: Seconds elapsed since the game started
 
         Returns:
             bool: True if job was accepted successfully
@@ -905,44 +1046,37 @@ class EasyAI(AbstractAI):
         if not order:
             return False
 
-        # Get current elapsed game time
-        game_time_remaining = game.get_game_time()
-        elapsed_game_time = game._game_time_limit_s - game_time_remaining
-
         # Mark as accepted
         order.state = "accepted"
         order.accepted_at = elapsed_game_time
 
         # Set deadline based on priority
-        if order.priority == 0:
-            base_time = 120
-        elif order.priority == 1:
-            base_time = 90
-        else:
-            base_time = 60
+        base_time = Order.base_time_for_priority(order.priority)
 
         order.deadline_s = elapsed_game_time + base_time
 
-        # Add to accepted orders list
-        if order not in self.accepted_orders:
-            self.accepted_orders.append(order)
+        # Add to accepted orders
+        if order.id not in self.accepted_orders:
+            self.accepted_orders[order.id] = order
 
         # Set as active if no active order
         if self.active_order is None:
             self.active_order = order
             self.target_position = order.pickup
             self.target_type = "pickup"
-            distance = abs(
-                self.x - order.pickup[0]) + abs(self.y - order.pickup[1])
-            print(
-                f"[EasyAI] Accepted job {order.id} (Priority {order.priority}) - heading to pickup at {order.pickup} (distance: {distance} tiles)")
+            if DEBUG:
+                distance = abs(
+                    self.x - order.pickup[0]) + abs(self.y - order.pickup[1])
+                print(
+                    f"[EasyAI] Accepted job {order.id} (Priority {order.priority}) - heading to pickup at {order.pickup} (distance: {distance} tiles)")
         else:
-            print(
-                f"[EasyAI] Accepted additional job {order.id} (Priority {order.priority}) - will handle after current job")
+            if DEBUG:
+                print(
+                    f"[EasyAI] Accepted additional job {order.id} (Priority {order.priority}) - will handle after current job")
 
         return True
 
-    def _get_random_direction(self, game):
+    def _get_random_direction(self, city):
         """
         Get a random valid movement direction.
 
@@ -951,112 +1085,158 @@ class EasyAI(AbstractAI):
         Complexity: O(1) per direction check
 
         Args:
-            game: The game instance to access city map
+            city: City map to move on
 
         Returns:
             tuple: (dx, dy) direction vector or None
         """
-        import random
+        # Walkable tiles around us (up, down, left, right that are open)
+        neighbors = city.get_walkable_neighbors(self.x, self.y)
+        if not neighbors:
+            # No valid direction found
+            return None
 
-        city = game.get_city()
+        # Don't step straight back the way we came unless it's a dead end
+        if self.direction_queue and len(neighbors) > 1:
+            last_dx, last_dy = self.direction_queue[-1]
+            back = (self.x - last_dx, self.y - last_dy)
+            if back in neighbors:
+                neighbors.remove(back)
 
-        # All possible directions: up, down, left, right
-        all_directions = [
-            (0, -1),   # UP
-            (0, 1),    # DOWN
-            (-1, 0),   # LEFT
-            (1, 0),    # RIGHT
-        ]
+        # Pick one uniformly, same as shuffling and taking the first valid
+        new_x, new_y = random.choice(neighbors)
+        direction = (new_x - self.x, new_y - self.y)
+        self.direction_queue.append(direction)
+        return direction
 
-        # Shuffle to randomize
-        random.shuffle(all_directions)
+    def _compute_path(self, city, start, goal):
+        """
+        Find a shortest walkable route from start to the tiles around goal.
 
-        # Try each direction until we find a valid one
-        for dx, dy in all_directions:
-            new_x = self.x + dx
-            new_y = self.y + dy
+        Pickup and dropoff points can sit on buildings, so any walkable tile
+        within one step of the goal (diagonals included) counts as arrived,
+        matching the distance <= 1 check in _check_pickup_delivery.
 
-            # Check if position is valid and not blocked
-            if city.is_valid_position(new_x, new_y) and not city.is_blocked(new_x, new_y):
-                return (dx, dy)
+        Uses A* with a heap as the open set. The heuristic is the Manhattan
+        distance to that 3x3 goal area, which never overestimates on a
+        4-connected grid.
+
+        Complexity: O(V log V) where V is the number of walkable tiles
+
+        Args:
+            city: City map to search
+            start: (x, y) starting tile
+            goal: (x, y) target position
+
+        Returns:
+            tuple or None: Tiles from start to the goal area (start
+            included), or None if the goal area cannot be reached
+        """
+        goal_x, goal_y = goal
+
+        # Cheap reject before searching: the goal area must share our region
+        if not any(city.same_component(start, (goal_x + ox, goal_y + oy))
+                   for ox in (-1, 0, 1) for oy in (-1, 0, 1)):
+            return None
+
+        def heuristic(x, y):
+            return (max(abs(x - goal_x) - 1, 0) +
+                    max(abs(y - goal_y) - 1, 0))
+
+        came_from = {start: None}
+        g_score = {start: 0}
+        open_set = [(heuristic(*start), 0, start)]
+
+        while open_set:
+            _, cost, current = heapq.heappop(open_set)
+            if cost > g_score[current]:
+                continue  # Stale heap entry
+
+            x, y = current
+            if abs(x - goal_x) <= 1 and abs(y - goal_y) <= 1:
+                # Walk the parents back to the start
+                path = []
+                while current is not None:
+                    path.append(current)
+                    current = came_from[current]
+                path.reverse()
+                return tuple(path)
+
+            next_cost = cost + 1
+            for neighbor in city.get_walkable_neighbors(x, y):
+                if next_cost < g_score.get(neighbor, next_cost + 1):
+                    g_score[neighbor] = next_cost
+                    came_from[neighbor] = current
+                    heapq.heappush(
+                        open_set,
+                        (next_cost + heuristic(*neighbor), next_cost, neighbor))
 
-        # No valid direction found
         return None
 
-    def _move_towards_target(self, game, target_pos):
+    def _next_path_tile(self, city, target_pos):
+        """
+        Get the next tile on the cached route to target_pos.
+
+        The route is recomputed only when the target changes or the AI has
+        left it (a random step, or a multi-tile move that ran past a turn).
+
+        Complexity: O(1) while on the route, one A* search otherwise
+
+        Args:
+            city: City map
+            target_pos: (x, y) target position
+
+        Returns:
+            tuple or None: (x, y) of the next tile, or None if already
+            there or the target cannot be reached
+        """
+        here = (self.x, self.y)
+        index = self._path_index.get(here)
+
+        if index is None or self._path_goal != target_pos:
+            path = self._compute_path(city, here, target_pos)
+            self._path = path or (here,)
+            self._path_index = {tile: i for i, tile in enumerate(self._path)}
+            self._path_goal = target_pos
+            index = 0
+
+        if index + 1 < len(self._path):
+            return self._path[index + 1]
+        return None
+
+    def _move_towards_target(self, city, weather, target_pos):
         """
         Make a movement that generally moves towards target.
 
-        Uses probabilistic approach: 85% chance to move towards target,
-        15% chance to move randomly (to avoid getting stuck).
+        85% of the time the AI follows an A* route to the target, cached
+        until the target changes or the AI strays from it. The other 15%
+        (or when no route exists) it moves randomly, which keeps the easy
+        difficulty from playing perfectly.
 
-        Complexity: O(1)
+        Complexity: O(1) per step on the cached route
 
         Args:
-            game: The game instance
+            city: City map to move on
+            weather: Current weather (affects speed and stamina)
             target_pos: (x, y) tuple of target position
 
         Returns:
             bool: True if movement was attempted
         """
-        import random
-
         if not target_pos:
             return False
 
-        target_x, target_y = target_pos
-        city = game.get_city()
-        weather = game.get_weather()
-
-        # Calculate general direction to target
-        dx = 0 if target_x == self.x else (1 if target_x > self.x else -1)
-        dy = 0 if target_y == self.y else (1 if target_y > self.y else -1)
-
-        # 85% chance to move towards target, 15% chance to move randomly (to avoid getting stuck)
-        if random.random() < 0.85 and (dx != 0 or dy != 0):
-            # Try to move towards target
-            # Prioritize the direction with larger distance
-            distance_x = abs(target_x - self.x)
-            distance_y = abs(target_y - self.y)
-
-            if dx != 0 and dy != 0:
-                # Need to move in both directions - choose the one with larger distance
-                if distance_x > distance_y:
-                    move_dx, move_dy = dx, 0
-                elif distance_y > distance_x:
-                    move_dx, move_dy = 0, dy
-                else:
-                    # Equal distance - randomly choose one
-                    if random.random() < 0.5:
-                        move_dx, move_dy = dx, 0
-                    else:
-                        move_dx, move_dy = 0, dy
-            else:
-                move_dx, move_dy = dx, dy
-
-            new_x = self.x + move_dx
-            new_y = self.y + move_dy
-
-            # Check if valid
-            if city.is_valid_position(new_x, new_y) and not city.is_blocked(new_x, new_y):
-                return self.move_to(new_x, new_y, city, weather)
-            else:
-                # Target direction is blocked, try the other direction
-                if move_dx != 0 and dy != 0:
-                    # Was trying to move in x, try y
-                    alt_x = self.x
-                    alt_y = self.y + dy
-                    if city.is_valid_position(alt_x, alt_y) and not city.is_blocked(alt_x, alt_y):
-                        return self.move_to(alt_x, alt_y, city, weather)
-                elif move_dy != 0 and dx != 0:
-                    # Was trying to move in y, try x
-                    alt_x = self.x + dx
-                    alt_y = self.y
-                    if city.is_valid_position(alt_x, alt_y) and not city.is_blocked(alt_x, alt_y):
-                        return self.move_to(alt_x, alt_y, city, weather)
-
-        # Random movement fallback (when probability fails or blocked)
-        direction = self._get_random_direction(game)
+        # 85% chance to move towards target, 15% chance to move randomly
+        # (one 8-bit draw: 218/256 is ~85%)
+        if random.getrandbits(8) < 218:
+            next_tile = self._next_path_tile(city, target_pos)
+            if next_tile:
+                self.direction_queue.append(
+                    (next_tile[0] - self.x, next_tile[1] - self.y))
+                return self.move_to(next_tile[0], next_tile[1], city, weather)
+
+        # Random movement fallback (when probability fails or no route)
+        direction = self._get_random_direction(city)
         if direction:
             dx, dy = direction
             new_x = self.x + dx
@@ -1065,7 +1245,7 @@ class EasyAI(AbstractAI):
 
         return False
 
-    def _check_pickup_delivery(self, game):
+    def _check_pickup_delivery(self, game, elapsed_game_time):
         """
         Check if AI is at pickup or delivery location and handle it.
 
@@ -1073,6 +1253,7 @@ class EasyAI(AbstractAI):
 
         Args:
             game: The game instance
+            elapsed_game_time: Seconds elapsed since the game started
 
         Returns:
             str or None: Status message if action was taken
@@ -1080,15 +1261,17 @@ class EasyAI(AbstractAI):
         if not self.active_order:
             return None
 
-        game_time_remaining = game.get_game_time()
-        elapsed_game_time = game._game_time_limit_s - game_time_remaining
+        # Nothing can change until we move or the order changes state
+        check_key = (self.x, self.y, self.active_order,
+                     self.active_order.state)
+        if check_key == self._last_pickup_check:
+            return None
+        self._last_pickup_check = check_key
 
         # Check pickup
         if self.active_order.state == "accepted":
-            pickup_x, pickup_y = self.active_order.pickup
-            distance = max(abs(self.x - pickup_x), abs(self.y - pickup_y))
-
-            if distance <= 1:  # Adjacent or at location
+            # Adjacent or at location
+            if self.active_order.is_near_pickup(self.x, self.y):
                 # Pick up the package
                 if self.weight + self.active_order.weight <= 8.0:
                     self.active_order.state = "carrying"
@@ -1099,21 +1282,21 @@ class EasyAI(AbstractAI):
                     self.target_position = self.active_order.dropoff
                     self.target_type = "dropoff"
 
-                    new_distance = abs(
-                        self.x - self.active_order.dropoff[0]) + abs(self.y - self.active_order.dropoff[1])
-                    print(
-                        f"[EasyAI] ✓ Picked up {self.active_order.id} - Now heading to dropoff at {self.active_order.dropoff} (distance: {new_distance} tiles)")
+                    if DEBUG:
+                        new_distance = abs(
+                            self.x - self.active_order.dropoff[0]) + abs(self.y - self.active_order.dropoff[1])
+                        print(
+                            f"[EasyAI] ✓ Picked up {self.active_order.id} - Now heading to dropoff at {self.active_order.dropoff} (distance: {new_distance} tiles)")
                     return f"Package {self.active_order.id} picked up"
                 else:
-                    print(
-                        f"[EasyAI] ✗ Cannot pick up {self.active_order.id} - overweight (current: {self.weight:.1f}, package: {self.active_order.weight:.1f})")
+                    if DEBUG:
+                        print(
+                            f"[EasyAI] ✗ Cannot pick up {self.active_order.id} - overweight (current: {self.weight:.1f}, package: {self.active_order.weight:.1f})")
 
         # Check delivery
         elif self.active_order.state == "carrying":
-            dropoff_x, dropoff_y = self.active_order.dropoff
-            distance = max(abs(self.x - dropoff_x), abs(self.y - dropoff_y))
-
-            if distance <= 1:  # Adjacent or at location
+            # Adjacent or at location
+            if self.active_order.is_near_dropoff(self.x, self.y):
                 # Deliver the package
                 deadline = getattr(self.active_order, 'deadline_s', 0)
                 overtime_seconds = max(0, elapsed_game_time - deadline)
@@ -1133,13 +1316,13 @@ class EasyAI(AbstractAI):
                 self.weight = max(0, self.weight - self.active_order.weight)
 
                 # Remove from accepted orders
-                if self.active_order in self.accepted_orders:
-                    self.accepted_orders.remove(self.active_order)
+                self.accepted_orders.pop(self.active_order.id, None)
 
                 delivered_id = self.active_order.id
-                timing_msg = "on time" if overtime_seconds == 0 else f"{overtime_seconds:.0f}s late"
-                print(
-                    f"[EasyAI] ✓ Delivered {delivered_id} ({timing_msg}) - Earned ${payout:.0f} - Reputation: {self.reputation:.1f}")
+                if DEBUG:
+                    timing_msg = "on time" if overtime_seconds == 0 else f"{overtime_seconds:.0f}s late"
+                    print(
+                        f"[EasyAI] ✓ Delivered {delivered_id} ({timing_msg}) - Earned ${payout:.0f} - Reputation: {self.reputation:.1f}")
 
                 # Clear active order and target
                 self.active_order = None
@@ -1148,13 +1331,15 @@ class EasyAI(AbstractAI):
 
                 # Select next order if available
                 if self.accepted_orders:
-                    self.active_order = self.accepted_orders[0]
+                    self.active_order = next(iter(self.accepted_orders.values()))
                     self.target_position = self.active_order.pickup if self.active_order.state == "accepted" else self.active_order.dropoff
                     self.target_type = "pickup" if self.active_order.state == "accepted" else "dropoff"
-                    print(
-                        f"[EasyAI] → Next job: {self.active_order.id} - heading to {self.target_type}")
+                    if DEBUG:
+                        print(
+                            f"[EasyAI] → Next job: {self.active_order.id} - heading to {self.target_type}")
                 else:
-                    print(f"[EasyAI] → All jobs completed, looking for new jobs...")
+                    if DEBUG:
+                        print(f"[EasyAI] → All jobs completed, looking for new jobs...")
 
                 return f"Delivered {delivered_id}"
 
@@ -1166,7 +1351,7 @@ class EasyAI(AbstractAI):
 
         This method implements random decision-making with basic queue-based
         movement. The AI:
-        1. Randomly selects available jobs
+        1. Selects the available job with the best priority index
         2. Moves towards targets with some randomness
         3. Uses FIFO queue for direction management
 
@@ -1186,8 +1371,17 @@ class EasyAI(AbstractAI):
         self.decision_timer += delta_time
         self.job_selection_timer += delta_time
 
+        # x/y only change when a step lands, so mid-step there is nothing
+        # new to pick up, deliver or move towards
+        if self.is_moving:
+            return
+
+        # Read the game clock once for this tick
+        game_time_remaining = game.get_game_time()
+        elapsed_game_time = game._game_time_limit_s - game_time_remaining
+
         # Check for pickup/delivery at current position
-        self._check_pickup_delivery(game)
+        self._check_pickup_delivery(game, elapsed_game_time)
 
         # Job selection logic - try to get a job if we don't have one
         # Try immediately if no active order, otherwise wait for interval
@@ -1201,37 +1395,39 @@ class EasyAI(AbstractAI):
         if should_select_job:
             # Only accept new jobs if we have capacity
             if len(self.accepted_orders) < 3 and self.weight < 8.0:
-                job = self._select_random_job(game)
+                job = self._select_job(
+                    game, game_time_remaining, elapsed_game_time)
                 if job:
-                    self._accept_job(game, job)
+                    self._accept_job(game, job, elapsed_game_time)
 
-        # Movement logic - only move if not currently animating (same as human player)
-        if not self.is_moving:
-            # If we have a target, move towards it
-            if self.target_position:
-                # Check if we're already at or very close to target
-                distance_to_target = max(
-                    abs(self.x - self.target_position[0]),
-                    abs(self.y - self.target_position[1])
-                )
+        # Movement logic - we are not animating here (same as human player)
+        city = game.get_city()
+        weather = game.get_weather()
 
-                if distance_to_target <= 1:
-                    # We're at the target - pickup/delivery should handle next step
-                    # Just stay here, don't move randomly
-                    pass
-                else:
-                    # Move towards the target
-                    self._move_towards_target(game, self.target_position)
+        # If we have a target, move towards it
+        if self.target_position:
+            # Check if we're already at or very close to target
+            distance_to_target = max(
+                abs(self.x - self.target_position[0]),
+                abs(self.y - self.target_position[1])
+            )
+
+            if distance_to_target <= 1:
+                # We're at the target - pickup/delivery should handle next step
+                # Just stay here, don't move randomly
+                pass
             else:
-                # No target - wander randomly
-                direction = self._get_random_direction(game)
-                if direction:
-                    city = game.get_city()
-                    weather = game.get_weather()
-                    dx, dy = direction
-                    new_x = self.x + dx
-                    new_y = self.y + dy
-                    self.move_to(new_x, new_y, city, weather)
+                # Move towards the target
+                self._move_towards_target(
+                    city, weather, self.target_position)
+        else:
+            # No target - wander randomly
+            direction = self._get_random_direction(city)
+            if direction:
+                dx, dy = direction
+                new_x = self.x + dx
+                new_y = self.y + dy
+                self.move_to(new_x, new_y, city, weather)
 
 
 class MediumAI(AbstractAI):
@@ -1254,6 +1450,16 @@ class MediumAI(AbstractAI):
     - Sorted list: Jobs sorted by heuristic score
     """
 
+    __slots__ = (
+        "accepted_orders", "active_order", "max_jobs",
+        "decision_timer", "decision_interval", "job_selection_timer",
+        "job_selection_interval", "alpha", "beta", "gamma",
+        "lookahead_depth", "max_branches", "target_position", "target_type",
+        "last_evaluation_results", "recent_positions", "last_direction",
+        "stuck_in_loop", "random_moves_remaining", "_debug_counter",
+        "city", "weather", "inventory",
+    )
+
     def __init__(self, start_x=0, start_y=0):
         """
         Initialize Medium AI with greedy evaluation capabilities.
@@ -1296,7 +1502,6 @@ class MediumAI(AbstractAI):
         self.max_branches = 4  # 4 directions per node (UP, DOWN, LEFT, RIGHT)
 
         # Anti-loop mechanism (improved)
-        from collections import deque
         self.recent_positions = deque(maxlen=12)  # Track more positions
         self.stuck_in_loop = False
         self.random_moves_remaining = 0
@@ -1369,9 +1574,6 @@ class MediumAI(AbstractAI):
         if not target_pos:
             return None
             
-        from collections import deque
-        import heapq
-        
         city = game.get_city()
         start = (self.x, self.y)
         goal = target_pos
@@ -1402,7 +1604,7 @@ class MediumAI(AbstractAI):
                 return first_dir
             
             # Try all 4 directions
-            for dx, dy in [(0, -1), (0, 1), (-1, 0), (1, 0)]:
+            for dx, dy in NEIGHBOR_OFFSETS:
                 new_x = current[0] + dx
                 new_y = current[1] + dy
                 next_pos = (new_x, new_y)
@@ -1410,9 +1612,7 @@ class MediumAI(AbstractAI):
                 # Skip if invalid or visited
                 if next_pos in visited:
                     continue
-                if not city.is_valid_position(new_x, new_y):
-                    continue
-                if city.is_blocked(new_x, new_y):
+                if not city.is_walkable(new_x, new_y):
                     continue
                 
                 # Calculate scores
@@ -1577,12 +1777,7 @@ class MediumAI(AbstractAI):
         order.accepted_at = elapsed_game_time
 
         # Set deadline based on priority
-        if order.priority == 0:
-            base_time = 120
-        elif order.priority == 1:
-            base_time = 90
-        else:
-            base_time = 60
+        base_time = Order.base_time_for_priority(order.priority)
 
         order.deadline_s = elapsed_game_time + base_time
 
@@ -1694,12 +1889,11 @@ class MediumAI(AbstractAI):
             score += 20.0  # Direct line to target
 
         # Terrain bonus (secondary, doesn't override distance)
-        if y < len(city.tiles) and x < len(city.tiles[0]):
-            tile_type = city.tiles[y][x]
-            if tile_type == 'C':  # Road
-                score += 3.0
-            elif tile_type == 'P':  # Park/grass
-                score += 1.0
+        tile_type = city.get_tile(x, y)
+        if tile_type == 'C':  # Road
+            score += 3.0
+        elif tile_type == 'P':  # Park/grass
+            score += 1.0
 
         return score
 
@@ -1739,7 +1933,6 @@ class MediumAI(AbstractAI):
         )
 
         # BFS to build tree level by level
-        from collections import deque
         queue = deque([root])
 
         while queue:
@@ -1749,21 +1942,14 @@ class MediumAI(AbstractAI):
             if current_node.depth >= depth:
                 continue
 
-            # Try all 4 directions
-            directions = [
-                (0, -1),   # UP
-                (0, 1),    # DOWN
-                (-1, 0),   # LEFT
-                (1, 0),    # RIGHT
-            ]
-
-            for dx, dy in directions:
+            # Try all 4 directions (up, down, left, right)
+            for dx, dy in NEIGHBOR_OFFSETS:
                 new_x = current_node.position[0] + dx
                 new_y = current_node.position[1] + dy
                 new_pos = (new_x, new_y)
 
                 # Check if valid move
-                if not city.is_valid_position(new_x, new_y) or city.is_blocked(new_x, new_y):
+                if not city.is_walkable(new_x, new_y):
                     continue
 
                 # Avoid immediate backtracking (don't go back to parent position)
@@ -1900,10 +2086,8 @@ class MediumAI(AbstractAI):
             score -= 100.0  # Heavy penalty for moving away
 
         # Terrain bonus (secondary consideration)
-        if new_y < len(city.tiles) and new_x < len(city.tiles[0]):
-            tile_type = city.tiles[new_y][new_x]
-            if tile_type == 'C':
-                score += 3.0
+        if city.get_tile(new_x, new_y) == 'C':
+            score += 3.0
 
         return score
 
@@ -1989,8 +2173,6 @@ class MediumAI(AbstractAI):
         Returns:
             tuple: (dx, dy) direction vector or None
         """
-        import random
-
         city = game.get_city()
 
         # All possible directions
@@ -2036,8 +2218,6 @@ class MediumAI(AbstractAI):
         Returns:
             bool: True if movement was made
         """
-        import random
-
         if not target_pos:
             return False
 
@@ -2358,6 +2538,17 @@ class HardAI(AbstractAI):
     Dijkstra's algorithm for pathfinding instead of greedy lookahead.
     """
 
+    __slots__ = (
+        "accepted_orders", "active_order", "max_jobs",
+        "decision_timer", "decision_interval", "job_selection_timer",
+        "job_selection_interval", "alpha", "beta", "gamma",
+        "target_position", "target_type", "current_path",
+        "path_recompute_needed", "is_idle_mode", "idle_center_position",
+        "idle_circle_points", "idle_current_circle_index",
+        "_idle_in_recovery", "_idle_recovery_target",
+        "city", "weather", "inventory",
+    )
+
     def __init__(self, start_x=0, start_y=0):
         """Initialize Hard AI with Dijkstra pathfinding."""
         super().__init__(start_x, start_y)
@@ -2488,8 +2679,6 @@ class HardAI(AbstractAI):
         Returns:
             list: List of (x, y) positions forming a circle
         """
-        import math
-
         circle_points = []
         num_points = 8  # 8 points around the circle
 
@@ -2686,9 +2875,9 @@ class HardAI(AbstractAI):
             return float('-inf')
 
         pickup_distance = self._manhattan_distance(
-            (self.x, self.y), tuple(order.pickup))
+            (self.x, self.y), order.pickup)
         delivery_distance = self._manhattan_distance(
-            tuple(order.pickup), tuple(order.dropoff))
+            order.pickup, order.dropoff)
         total_distance = pickup_distance + delivery_distance
 
         base_score = self.alpha * order.payout - self.beta * total_distance
@@ -2808,12 +2997,7 @@ class HardAI(AbstractAI):
         order.state = "accepted"
         order.accepted_at = elapsed_game_time
 
-        if order.priority == 0:
-            base_time = 120
-        elif order.priority == 1:
-            base_time = 90
-        else:
-            base_time = 60
+        base_time = Order.base_time_for_priority(order.priority)
 
         order.deadline_s = elapsed_game_time + base_time
 
@@ -2824,7 +3008,7 @@ class HardAI(AbstractAI):
             self.active_order = order
             # FIX: Find accessible position near pickup
             accessible_pickup = self._find_nearest_accessible_position(
-                game, tuple(order.pickup))
+                game, order.pickup)
             self.target_position = accessible_pickup
             self.target_type = "pickup"
             self.current_path = []
@@ -2832,7 +3016,7 @@ class HardAI(AbstractAI):
                 (self.x, self.y), self.target_position)
             print(
                 f"[HardAI] ✓ Accepted job {order.id} (Priority {order.priority}, ${order.payout}) - distance: {distance} tiles")
-            if accessible_pickup != tuple(order.pickup):
+            if accessible_pickup != order.pickup:
                 print(
                     f"[HardAI]   Note: Pickup at {order.pickup} is blocked, targeting adjacent {accessible_pickup}")
         else:
@@ -2853,12 +3037,8 @@ class HardAI(AbstractAI):
         if weather:
             weather_mult = max(0.3, weather.get_speed_multiplier())
 
-        if self.resistance_state == "normal":
-            resistance_mult = 1.0
-        elif self.resistance_state == "tired":
-            resistance_mult = 1.2
-        else:
-            resistance_mult = 1.5
+        resistance_mult = RESISTANCE_PATH_COSTS.get(
+            self.resistance_state, 1.5)
 
         final_cost = (base_cost * resistance_mult) / weather_mult
         return final_cost
@@ -2919,7 +3099,10 @@ class HardAI(AbstractAI):
             print("[HardAI] ERROR: No weather reference available")
             return None
 
-        import heapq
+        # Unreachable goals would otherwise flood the whole region
+        if city.is_walkable(*start) and not city.same_component(start, goal):
+            print(f"[HardAI] ✗ No path found to target!")
+            return None
 
         frontier = []
         heapq.heappush(frontier, (0.0, start))
@@ -2963,19 +3146,9 @@ class HardAI(AbstractAI):
 
                 return path
 
-            x, y = current_pos
-            neighbors = [
-                (x, y - 1),  # North
-                (x, y + 1),  # South
-                (x - 1, y),  # West
-                (x + 1, y)   # East
-            ]
-
-            for nx, ny in neighbors:
-                if not city.is_valid_position(nx, ny) or city.is_blocked(nx, ny):
-                    continue
-
-                neighbor_pos = (nx, ny)
+            # North, South, West, East
+            for neighbor_pos in city.get_walkable_neighbors(*current_pos):
+                nx, ny = neighbor_pos
                 move_cost = self._get_tile_cost(game, nx, ny)
                 new_cost = cost_so_far[current_pos] + move_cost
 
@@ -3075,14 +3248,7 @@ class HardAI(AbstractAI):
         self.update_stamina_after_move(virtual_distance, weather, city)
 
         # Update direction for animation
-        if target_x > self.x:
-            self.current_direction = "RIGHT"
-        elif target_x < self.x:
-            self.current_direction = "LEFT"
-        elif target_y > self.y:
-            self.current_direction = "DOWN"
-        elif target_y < self.y:
-            self.current_direction = "UP"
+        self.face_towards(target_x, target_y)
 
         return True
 
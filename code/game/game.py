@@ -7,6 +7,7 @@ from typing import Optional
 from ..services.data_manager import DataManager
 from ..weather.weather import Weather
 from ..core.city import City
+from ..core.order import set_game_time_limit
 from .jobs_inventory import JobsInventory
 from .player_inventory import PlayerInventory
 from .scoreboard import Scoreboard
@@ -65,6 +66,7 @@ class Game:
         self._is_playing: bool = False
         self._paused: bool = False
         self._game_time_limit_s: float = 600.0
+        set_game_time_limit(self._game_time_limit_s)
         self._game_time_s: float = 600.0
         self._weather_timer: float = 0.0
         self._burst_period_s: float = 55.0
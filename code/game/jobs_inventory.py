@@ -6,9 +6,10 @@ It loads jobs from data files, sorts them by priority or payment,
 and lets the player browse through them to choose which ones to accept.
 """
 
+from operator import attrgetter
 from typing import List, Optional
 from ..services.data_manager import DataManager
-from ..core.order import Order
+from ..core.order import Order, game_time_limit
 
 
 class JobsInventory:
@@ -62,15 +63,16 @@ class JobsInventory:
                     priority=int(job.get("priority", 0)),
                     release_time=release_time,
                 )
-                # align to weather start_time
-                o.set_deadline_from_start(weather_start_iso)
                 orders.append(o)
                 print(
                     f"  Loaded order {o.id}: priority={o.priority}, payout={o.payout}, release_time={release_time}s, state={o.state}")
 
+            # align to weather start_time
+            Order.bulk_set_deadlines(orders, weather_start_iso)
+
         # Sort orders by priority (descending) and then by payout (descending)
         # Higher priority jobs appear first, and within same priority, higher paying jobs first
-        orders.sort(key=lambda order: (-order.priority, -order.payout))
+        orders.sort(key=attrgetter("sort_key"))
 
         self._orders = orders
         print(f"JobsInventory: Loaded and sorted {len(self._orders)} orders")
@@ -78,13 +80,14 @@ class JobsInventory:
     def all(self) -> List[Order]:
         return self._orders
 
-    def selectable(self, t: float) -> List[Order]:
+    def selectable(self, t: float, max_weight: Optional[float] = None) -> List[Order]:
         """
         Get orders that are available for selection.
         CRITICAL: Orders must be selectable regardless of deadline!
 
         Args:
             t: Current game time remaining (countdown from 600s)
+            max_weight: If given, leave out orders heavier than this
         """
         from .game import Game
         game = Game()
@@ -101,7 +104,9 @@ class JobsInventory:
                 # Check if release time has passed
                 if elapsed_game_time >= order_release_time:
                     # Order is available for selection - add to list
-                    available_orders.append(o)
+                    # (unless the caller can't carry it)
+                    if max_weight is None or o.weight <= max_weight:
+                        available_orders.append(o)
 
                     # Log first release
                     if not hasattr(o, '_was_released') or not o._was_released:
@@ -123,8 +128,7 @@ class JobsInventory:
                     o._last_debug_time = elapsed_game_time
 
         # Sort available orders by priority (descending) and payout (descending)
-        available_orders.sort(
-            key=lambda order: (-order.priority, -order.payout))
+        available_orders.sort(key=attrgetter("sort_key"))
 
         return available_orders
 
@@ -241,8 +245,17 @@ class JobsInventory:
     def mark_expired(self, t: float) -> None:
         """Mark orders as expired only if they meet is_expired() criteria
         IMPORTANT: Do NOT expire orders just because deadline has passed!"""
+        time_limit = game_time_limit()
+        if time_limit is None:
+            return  # No game clock yet
+        elapsed_game_time = time_limit - t
+
         for o in self._orders:
-            if o.is_expired(t) and o.state != "expired":
+            # Only available orders can expire; delivered, accepted, etc.
+            # are skipped here without a method call
+            if o.state != "available":
+                continue
+            if o.is_expired_at(elapsed_game_time):
                 print(f"Order {o.id} marked as expired by JobsInventory")
                 o.state = "expired"
 
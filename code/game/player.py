@@ -2,6 +2,16 @@ import pygame
 import os
 from .undo_sistem import UndoSystem
 
+# Extra stamina lost per cell moved under each weather condition
+WEATHER_STAMINA_PENALTIES = {
+    "rain": -0.1,
+    "rain_light": -0.1,
+    "wind": -0.1,
+    "storm": -0.3,
+    "heat": -0.2,
+    "cold": -0.1,
+}
+
 
 class Player:
     def __init__(self, start_x=0, start_y=0):
@@ -501,17 +511,9 @@ class Player:
 
         # Weather impact on stamina
         weather_penalty = 0.0
-        if weather and hasattr(weather, 'current_condition'):
-            weather_impacts = {
-                "rain": -0.1 * distance_moved,
-                "rain_light": -0.1 * distance_moved,
-                "wind": -0.1 * distance_moved,
-                "storm": -0.3 * distance_moved,
-                "heat": -0.2 * distance_moved,
-                "cold": -0.1 * distance_moved,
-            }
-            weather_penalty = weather_impacts.get(
-                weather.current_condition, 0.0)
+        if weather is not None:
+            weather_penalty = WEATHER_STAMINA_PENALTIES.get(
+                weather.current_condition, 0.0) * distance_moved
 
         # Total stamina loss
         total_stamina_loss = base_stamina_loss + weight_penalty + weather_penalty
@@ -85,13 +85,7 @@ class PlayerInventory:
         elapsed_game_time = game._game_time_limit_s - game.get_game_time()
 
         # Set deadlines based on priority - ALWAYS calculate from CURRENT time
-        # Priority 0 = 120s, Priority 1 = 90s, Priority 2+ = 60s
-        if o.priority == 0:
-            base_time = 120
-        elif o.priority == 1:
-            base_time = 90
-        else:
-            base_time = 60  # Priority 2+
+        base_time = Order.base_time_for_priority(o.priority)
 
         # Set deadline to current elapsed time + allowed time
         o.deadline_s = elapsed_game_time + base_time
@@ -120,26 +114,16 @@ class PlayerInventory:
         if not order.pickup:
             return False
 
-        pickup_x, pickup_y = order.pickup[0], order.pickup[1]
-
         # Check if player is at pickup location or adjacent (within 1 tile)
-        distance = max(abs(px - pickup_x), abs(py - pickup_y))
-        is_adjacent = distance <= 1
-
-        return is_adjacent
+        return order.is_near_pickup(px, py)
 
     def is_adjacent_to_dropoff(self, px: int, py: int, order) -> bool:
         """Check if player is at or adjacent to dropoff location"""
         if not order.dropoff:
             return False
 
-        dropoff_x, dropoff_y = order.dropoff[0], order.dropoff[1]
-
         # Check if player is at dropoff location or adjacent (within 1 tile)
-        distance = max(abs(px - dropoff_x), abs(py - dropoff_y))
-        is_adjacent = distance <= 1
-
-        return is_adjacent
+        return order.is_near_dropoff(px, py)
 
     def on_player_step(self, px: int, py: int, game_time_s: float) -> Optional[str]:
         if not self.active:
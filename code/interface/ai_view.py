@@ -1,6 +1,10 @@
 import pygame
 import os
 
+# How many sprite sizes to keep scaled copies of (window resizes tend to
+# bounce between a few sizes)
+SCALED_SPRITE_CACHE_SIZE = 4
+
 
 class AIView:
     def __init__(self, ai_bot):
@@ -11,6 +15,12 @@ class AIView:
         self.current_sprite_size = 24
         self.sprites = {}
         self.original_sprites = {}
+        # size -> {direction: scaled sprite}
+        self._scaled_sprites = {}
+
+        # Map cell size last set through on_cell_size_change
+        self._cell_size = None
+        self._half_cell = 0
 
         # Animation state
         self.animation_frame = 0
@@ -24,6 +34,7 @@ class AIView:
         """Load AI sprites for rendering"""
         self.original_sprites = {}
         self.sprites = {}
+        self._scaled_sprites = {}
 
         sprite_files = {
             "UP": "code/assets/ai/ai_UP.PNG",
@@ -105,24 +116,46 @@ class AIView:
         if new_size != self.current_sprite_size:
             self.current_sprite_size = new_size
 
-            for direction, original in self.original_sprites.items():
-                if original:
-                    self.sprites[direction] = pygame.transform.scale(
-                        original, (new_size, new_size))
+            # Reuse sprites already scaled to this size
+            scaled = self._scaled_sprites.get(new_size)
+            if scaled is None:
+                scaled = {}
+                for direction, original in self.original_sprites.items():
+                    if original:
+                        scaled[direction] = pygame.transform.scale(
+                            original, (new_size, new_size))
+
+                # Drop the oldest size once the cache is full
+                if len(self._scaled_sprites) >= SCALED_SPRITE_CACHE_SIZE:
+                    del self._scaled_sprites[next(iter(self._scaled_sprites))]
+                self._scaled_sprites[new_size] = scaled
+
+            self.sprites.update(scaled)
+
+    def on_cell_size_change(self, cell_size):
+        """Rescale sprites for a new map cell size (call when the layout changes)"""
+        self._cell_size = cell_size
+        self._half_cell = cell_size // 2
+        self.update_sprite_scale(cell_size)
 
     def get_screen_position(self, cell_size, map_offset_x, map_offset_y):
         """Get AI bot screen position with smooth interpolation"""
-        if self.ai_bot.is_moving:
-            current_x = self.ai_bot.x + \
-                (self.ai_bot.target_x - self.ai_bot.x) * self.ai_bot.move_progress
-            current_y = self.ai_bot.y + \
-                (self.ai_bot.target_y - self.ai_bot.y) * self.ai_bot.move_progress
+        ai_bot = self.ai_bot
+        if cell_size == self._cell_size:
+            half_cell = self._half_cell
         else:
-            current_x = self.ai_bot.x
-            current_y = self.ai_bot.y
+            half_cell = cell_size // 2
 
-        screen_x = map_offset_x + current_x * cell_size + (cell_size // 2)
-        screen_y = map_offset_y + current_y * cell_size + (cell_size // 2)
+        if not ai_bot.is_moving:
+            # Standing on a tile, no interpolation needed
+            return (map_offset_x + ai_bot.x * cell_size + half_cell,
+                    map_offset_y + ai_bot.y * cell_size + half_cell)
+
+        current_x = ai_bot.x + (ai_bot.target_x - ai_bot.x) * ai_bot.move_progress
+        current_y = ai_bot.y + (ai_bot.target_y - ai_bot.y) * ai_bot.move_progress
+
+        screen_x = map_offset_x + current_x * cell_size + half_cell
+        screen_y = map_offset_y + current_y * cell_size + half_cell
 
         return int(screen_x), int(screen_y)
 
@@ -138,8 +171,7 @@ class AIView:
         if not self.ai_bot:
             return
 
-        # Update sprite scale if needed
-        self.update_sprite_scale(cell_size)
+        # Sprites are rescaled through on_cell_size_change, not per frame
 
         # Get screen position
         screen_x, screen_y = self.get_screen_position(
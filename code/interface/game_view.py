@@ -1171,6 +1171,7 @@ class GameView(BaseView):
             # Initialize and start AI if present
             if hasattr(self.game, 'ai_bot') and self.game.ai_bot:
                 self.ai_view = AIView(self.game.ai_bot)
+                self.ai_view.on_cell_size_change(self.cell_size)
                 print(
                     f"GameView: AI view initialized for {self.game.ai_bot.get_name()}")
 
@@ -1,9 +1,11 @@
 import pickle
 import os
+import sys
 from pathlib import Path
 from datetime import datetime
 from typing import Optional, Dict, Any
 from ..game.game import Game
+from ..core.order import set_game_time_limit
 
 
 class GameSaveManager:
@@ -245,8 +247,7 @@ class GameSaveManager:
                     '_last_debug_time': getattr(order, '_last_debug_time', None),
                     # Save overtime tracking flags
                     '_deadline_passed': getattr(order, '_deadline_passed', False),
-                    '_already_expired': getattr(order, '_already_expired', False),
-                    '_deadline_debug_printed': getattr(order, '_deadline_debug_printed', False)
+                    '_already_expired': getattr(order, '_already_expired', False)
                 }
                 jobs_state['orders'].append(order_data)
 
@@ -338,6 +339,7 @@ class GameSaveManager:
             game._player_name = game_state['player_name']
             game._game_time_s = game_state['game_time_s']
             game._game_time_limit_s = game_state['game_time_limit_s']
+            set_game_time_limit(game._game_time_limit_s)
             game._weather_timer = game_state['weather_timer']
             game._burst_period_s = game_state['burst_period_s']
             game._transition_s = game_state['transition_s']
@@ -466,7 +468,7 @@ class GameSaveManager:
 
                     # Set state and timing attributes after creation
                     if 'state' in order_data:
-                        order.state = order_data['state']
+                        order.state = sys.intern(order_data['state'])
                     if 'accepted_at' in order_data:
                         order.accepted_at = order_data['accepted_at']
                     if 'picked_at' in order_data:
@@ -487,8 +489,6 @@ class GameSaveManager:
                         order._deadline_passed = order_data['_deadline_passed']
                     if '_already_expired' in order_data:
                         order._already_expired = order_data['_already_expired']
-                    if '_deadline_debug_printed' in order_data:
-                        order._deadline_debug_printed = order_data['_deadline_debug_printed']
 
                     jobs._orders.append(order)
 
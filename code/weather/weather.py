@@ -7,6 +7,19 @@ changes over time using probability patterns.
 """
 
 import datetime
+import functools
+import random
+from itertools import accumulate
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_iso(timestamp):
+    """Parse an ISO 8601 timestamp, accepting a trailing 'Z' for UTC.
+
+    Weather is rebuilt on every new game and save load with the same
+    burst data, so each distinct string is only parsed once.
+    """
+    return datetime.datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
 
 
 class Weather:
@@ -30,6 +43,14 @@ class Weather:
         "cold": 0.92
     }
 
+    __slots__ = (
+        "city", "initial_condition", "conditions", "transition_matrix",
+        "_current_condition", "_speed_multiplier", "current_intensity",
+        "start_time", "bursts", "meta",
+        "_transition_table", "_transition_source",
+        "_burst_windows", "_burst_source",
+    )
+
     def __init__(self):
         """
         Create a new weather system.
@@ -42,6 +63,11 @@ class Weather:
         self.conditions = ["clear"]
         self.transition_matrix = {}
 
+        # Per-condition (conditions, cumulative probabilities) tables built
+        # from transition_matrix, rebuilt whenever it is replaced
+        self._transition_table = {}
+        self._transition_source = None
+
         # Current weather state
         self.current_condition = "clear"
         self.current_intensity = 0.0
@@ -51,6 +77,11 @@ class Weather:
         self.bursts = []
         self.meta = {}
 
+        # Parsed (burst, start, end) windows, rebuilt whenever bursts is
+        # replaced
+        self._burst_windows = []
+        self._burst_source = None
+
     @staticmethod
     def from_data_manager():
         """
@@ -86,6 +117,18 @@ class Weather:
     def get_current_intensity(self):
         return self.current_intensity
 
+    @property
+    def current_condition(self):
+        return self._current_condition
+
+    @current_condition.setter
+    def current_condition(self, condition):
+        # Resolve the speed multiplier once per weather change, since
+        # get_speed_multiplier is read for every move and path step
+        self._current_condition = condition
+        # Default to 1.0 if condition not found
+        self._speed_multiplier = self.SPEED_MULTIPLIERS.get(condition, 1.0)
+
     def get_speed_multiplier(self):
         """
         Get how fast the player can move in current weather.
@@ -94,24 +137,40 @@ class Weather:
         - 1.0 = normal speed (clear weather)
         - 0.75 = 75% speed (storm)
         """
-        # Default to 1.0 if condition not found
-        return self.SPEED_MULTIPLIERS.get(self.current_condition, 1.0)
+        return self._speed_multiplier
 
-    def update_weather(self):
-        import random
+    def _get_transitions(self, condition):
+        """
+        Get the possible next conditions and their probabilities.
+
+        The tables are built once from transition_matrix instead of
+        copying its keys and values into new lists on every weather change.
+        Probabilities are stored already summed so random.choices can use
+        them as cum_weights without accumulating them again each call.
+
+        Returns:
+            tuple: (conditions, cumulative probabilities) or None if no
+            transitions
+        """
+        if self._transition_source is not self.transition_matrix:
+            self._transition_table = {
+                cond: (tuple(row.keys()), tuple(accumulate(row.values())))
+                for cond, row in self.transition_matrix.items() if row
+            }
+            self._transition_source = self.transition_matrix
+        return self._transition_table.get(condition)
 
+    def update_weather(self):
         # Get possible transitions for the current condition
-        transitions = self.transition_matrix.get(self.current_condition, {})
+        transitions = self._get_transitions(self.current_condition)
         if not transitions:
             return  # No transitions available
 
-        # Create a list of conditions and their corresponding probabilities
-        conditions = list(transitions.keys())
-        probabilities = list(transitions.values())
+        conditions, cum_probabilities = transitions
 
         # Choose the next condition based on the transition probabilities
         self.current_condition = random.choices(
-            conditions, weights=probabilities)[0]
+            conditions, cum_weights=cum_probabilities)[0]
         self.current_intensity = random.uniform(
             0.0, 1.0)  # Reset intensity for new condition
         # Optionally, you could implement intensity changes based on condition
@@ -159,22 +218,17 @@ class Weather:
         return success_seed or success_burst
 
     def next_weather(self):
-        import random
-
         old_condition = self.current_condition  # Save old condition (aux)
         old_intensity = self.current_intensity  # Save old intensity (aux)
 
         # Get conditions and probabilities for current condition
-        transitions = self.transition_matrix.get(self.current_condition, {})
-
-        if transitions:
-            # Get lists of conditions and their probabilities
-            conditions = list(transitions.keys())
-            probabilities = list(transitions.values())
+        conditions, cum_probabilities = (
+            self._get_transitions(self.current_condition) or ((), ()))
 
+        if conditions:
             # Update to the new condition using Markov
             self.current_condition = random.choices(
-                conditions, weights=probabilities)[0]
+                conditions, cum_weights=cum_probabilities)[0]
             # Intensity random between 0.0 and 1.0 for new condition, later overridden if burst found
             self.current_intensity = random.uniform(0.0, 1.0)
         else:
@@ -197,7 +251,7 @@ class Weather:
                 "old_intensity": old_intensity,
                 "new_intensity": self.current_intensity,
                 "burst_info": active_burst,
-                "transitions_used": len(transitions)
+                "transitions_used": len(conditions)
             }
         else:
             # If no active burst, keep the random intensity from Markov
@@ -207,82 +261,71 @@ class Weather:
                 "new_condition": self.current_condition,
                 "old_intensity": old_intensity,
                 "new_intensity": self.current_intensity,
-                "transitions_used": len(transitions)
+                "transitions_used": len(conditions)
             }
 
-    def _get_active_burst_for_condition(self, target_condition):
+    def _get_burst_windows(self):
+        """
+        Get the (burst, start, end) time window of every burst.
+
+        Burst times are parsed once per bursts list instead of on every
+        lookup; the windows are rebuilt whenever bursts is replaced.
+        Bursts whose times can't be parsed are reported once and skipped.
+        """
+        if self._burst_source is not self.bursts:
+            windows = []
+            for burst in self.bursts:
+                try:
+                    burst_start = _parse_iso(burst["from"])
+                    burst_end = burst_start + \
+                        datetime.timedelta(seconds=burst["duration_sec"])
+                except Exception as e:
+                    print(f"Weather Class: Error parsing burst: {e}")
+                    continue  # Continuar con el siguiente burst
+                windows.append((burst, burst_start, burst_end))
+            self._burst_windows = windows
+            self._burst_source = self.bursts
+        return self._burst_windows
 
-        from datetime import datetime, timezone, timedelta
+    @staticmethod
+    def _burst_status(burst, burst_end, current_time):
+        """Build the active burst info returned by the burst lookups."""
+        remaining_sec = int((burst_end - current_time).total_seconds())
+
+        return {
+            "condition": burst["condition"],
+            "intensity": burst["intensity"],
+            "duration_sec": burst["duration_sec"],
+            "remaining_sec": remaining_sec,
+            "from": burst["from"]
+        }
 
+    def _get_active_burst_for_condition(self, target_condition):
         try:
-            current_time = datetime.now(timezone.utc)
+            current_time = datetime.datetime.now(datetime.timezone.utc)
         except Exception as e:
             print(f"Weather Class: Error getting current time: {e}")
             return None
 
-        for burst in self.bursts:
-            if burst["condition"] == target_condition:
-                try:
-                    # Mover la declaración de variables dentro del try específico
-                    burst_start = datetime.fromisoformat(
-                        burst["from"].replace('Z', '+00:00'))
-                    burst_end = burst_start + \
-                        timedelta(seconds=burst["duration_sec"])
-
-                    # Verificar si el burst está activo en este momento
-                    if burst_start <= current_time < burst_end:
-                        remaining_sec = int(
-                            (burst_end - current_time).total_seconds())
-
-                        return {
-                            "condition": burst["condition"],
-                            "intensity": burst["intensity"],
-                            "duration_sec": burst["duration_sec"],
-                            "remaining_sec": remaining_sec,
-                            "from": burst["from"]
-                        }
-
-                except Exception as e:
-                    print(
-                        f"Weather Class: Error parsing burst for condition '{target_condition}': {e}")
-                    continue
+        for burst, burst_start, burst_end in self._get_burst_windows():
+            # Verificar si el burst está activo en este momento
+            if (burst["condition"] == target_condition and
+                    burst_start <= current_time < burst_end):
+                return self._burst_status(burst, burst_end, current_time)
 
         return None
 
     def _get_active_burst(self):
-
-        from datetime import datetime, timezone, timedelta
-
         # Obtener tiempo actual una sola vez
         try:
-            current_time = datetime.now(timezone.utc)
+            current_time = datetime.datetime.now(datetime.timezone.utc)
         except Exception as e:
             print(f"Weather Class: Error getting current time: {e}")
             return None
 
-        for burst in self.bursts:
-            try:
-                # Variables dentro del try específico para cada burst
-                burst_start = datetime.fromisoformat(
-                    burst["from"].replace('Z', '+00:00'))
-                burst_end = burst_start + \
-                    timedelta(seconds=burst["duration_sec"])
-
-                if burst_start <= current_time < burst_end:
-                    remaining_sec = int(
-                        (burst_end - current_time).total_seconds())
-
-                    return {
-                        "condition": burst["condition"],
-                        "intensity": burst["intensity"],
-                        "duration_sec": burst["duration_sec"],
-                        "remaining_sec": remaining_sec,
-                        "from": burst["from"]
-                    }
-
-            except Exception as e:
-                print(f"Weather Class: Error parsing burst: {e}")
-                continue  # Continuar con el siguiente burst
+        for burst, burst_start, burst_end in self._get_burst_windows():
+            if burst_start <= current_time < burst_end:
+                return self._burst_status(burst, burst_end, current_time)
 
         return None
 